@@ -7,16 +7,36 @@ import subprocess
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def load_json_file(path):
+    """读取JSON文件，优先使用orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def run_command(cmd):
     """运行命令并显示输出"""
     print(f"🔄 执行命令: {' '.join(cmd)}")
     print("-" * 50)
-    result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-    print(result.stdout)
-    if result.stderr:
-        print(f"❌ 错误: {result.stderr}")
+    # 逐行转发子进程输出，避免大输出整体缓冲在内存中
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, encoding='utf-8', bufsize=1)
+    for line in proc.stdout:
+        print(line, end='')
+    returncode = proc.wait()
+    if returncode != 0:
+        print(f"❌ 命令退出码: {returncode}")
     print("=" * 50)
-    return result.returncode == 0
+    return returncode == 0
 
 def main():
     print("📄 论文结构化信息抽取功能演示")
@@ -57,9 +77,7 @@ def main():
     if extracted_files:
         print(f"\n5️⃣ JSON文件内容预览 ({extracted_files[0].name}):")
         try:
-            import json
-            with open(extracted_files[0], 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(extracted_files[0])
             
             print("📋 元数据:")
             metadata = data.get('metadata', {})
@@ -68,7 +86,11 @@ def main():
             
             print("\n📄 抽取的字段:")
             extracted_info = data.get('extracted_info', {})
-            for field, content in extracted_info.items():
+            max_preview_fields = 20
+            for i, (field, content) in enumerate(extracted_info.items()):
+                if i >= max_preview_fields:
+                    print(f"  … (+{len(extracted_info) - i} 个字段未显示)")
+                    break
                 if content and str(content).strip():
                     content_preview = str(content)[:100] + "..." if len(str(content)) > 100 else str(content)
                     print(f"  • {field}: {content_preview}")
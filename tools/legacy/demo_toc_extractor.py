@@ -7,6 +7,8 @@ AI智能目录抽取器使用示例
 
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # 添加src路径到系统路径
@@ -49,19 +51,16 @@ def demo_usage():
             # 保存到多种格式
             output_base = file_path.stem + "_extracted_toc"
             
-            # JSON格式 - 适合程序处理
-            json_file = f"{output_base}.json"
-            extractor.save_toc(toc, json_file, 'json')
-            print(f" JSON格式已保存: {json_file}")
+            json_file = f"{output_base}.json"   # JSON格式 - 适合程序处理
+            md_file = f"{output_base}.md"       # Markdown格式 - 适合阅读和展示
+            txt_file = f"{output_base}.txt"     # 文本格式 - 适合简单查看
+            exports = [(json_file, 'json'), (md_file, 'markdown'), (txt_file, 'txt')]
             
-            # Markdown格式 - 适合阅读和展示
-            md_file = f"{output_base}.md"
-            extractor.save_toc(toc, md_file, 'markdown')
+            # 文件写入会释放GIL，三种格式并行导出
+            with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+                list(executor.map(lambda args: extractor.save_toc(toc, *args), exports))
+            print(f" JSON格式已保存: {json_file}")
             print(f" Markdown格式已保存: {md_file}")
-            
-            # 文本格式 - 适合简单查看
-            txt_file = f"{output_base}.txt"
-            extractor.save_toc(toc, txt_file, 'txt')
             print(f" 文本格式已保存: {txt_file}")
             
             # 统计信息
@@ -71,9 +70,7 @@ def demo_usage():
             print(f"   - 置信度: {toc.confidence_score:.2f}")
             
             # 各层级统计
-            level_stats = {}
-            for entry in toc.entries:
-                level_stats[entry.level] = level_stats.get(entry.level, 0) + 1
+            level_stats = Counter(entry.level for entry in toc.entries)
             
             print(f"   - 层级分布:")
             for level in sorted(level_stats.keys()):
@@ -117,8 +114,11 @@ def analyze_extraction_quality():
     main_chapters = [e for e in toc.entries if e.level == 1]
     print(f"   主章节数: {len(main_chapters)}")
     
+    # 一次遍历统计各章子章节数（按编号首段归属章节，如 "2.3.1" -> "2"）
+    sub_counts = Counter(e.number.split('.', 1)[0] for e in toc.entries if e.level > 1)
+    
     for chapter in main_chapters[:5]:  # 显示前5个主章节
-        sub_count = len([e for e in toc.entries if e.number.startswith(chapter.number.replace('第', '').replace('章', '')) and e.level > 1])
+        sub_count = sub_counts[chapter.number.replace('第', '').replace('章', '')]
         print(f"   - {chapter.number} {chapter.title}: {sub_count} 个子章节")
     
     # 3. 问题识别
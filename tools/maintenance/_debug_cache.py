@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""调试脚本共用的文献数据缓存：按文件内容SHA-256缓存解析结果"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson as _json  # C实现，直接解析bytes，省去utf-8解码
+except ImportError:
+    import json as _json
+
+# 缓存目录固定在项目根目录下（已加入 .gitignore），与运行时的工作目录无关
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEBUG_CACHE_DIR = PROJECT_ROOT / "cache" / "debug"
+
+
+def write_pickle_atomic(cache_file, value):
+    """先写同目录下的临时文件再原子替换：中断的写入不会留下截断的缓存文件"""
+    cache_file = Path(cache_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_papers(path):
+    """读取文献JSON，文件内容不变时直接复用上次的解析结果"""
+    raw = Path(path).read_bytes()
+    content_sha256 = hashlib.sha256(raw).hexdigest()
+    cache_file = DEBUG_CACHE_DIR / f"{content_sha256}.pkl"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ 读取调试缓存失败，重新解析: {e}")
+
+    papers = _json.loads(raw)
+    # 损坏的缓存文件在这里被新结果整体替换
+    try:
+        write_pickle_atomic(cache_file, papers)
+    except OSError as e:
+        print(f"⚠️ 写入调试缓存失败: {e}")
+    return papers
+
+
+def flatten_authors(papers):
+    """把所有论文的作者展开成一个扁平元组，只保留dict条目，类型检查只做一次"""
+    return tuple(
+        author
+        for paper in papers
+        for author in paper.get('Authors') or ()
+        if isinstance(author, dict)
+    )
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""调试脚本共用的docx读取工具：XPath直接读取段落文本、批量加载文档"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+import docx
+from lxml import etree
+
+# WordprocessingML 命名空间；XPath 预编译一次，由 lxml 在C层遍历
+W_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+W = '{%s}' % W_NS['w']
+BODY_PARAGRAPHS_XPATH = etree.XPath('./w:p', namespaces=W_NS)
+# 段落直属 run 及超链接内 run 的文本内容元素，与 python-docx 的 Run.text 取同一组元素
+PARAGRAPH_TEXT_XPATH = etree.XPath(
+    './w:r/w:t/text() | ./w:r/w:tab | ./w:r/w:ptab | ./w:r/w:br | ./w:r/w:cr | ./w:r/w:noBreakHyphen'
+    ' | ./w:hyperlink/w:r/w:t/text() | ./w:hyperlink/w:r/w:tab | ./w:hyperlink/w:r/w:ptab'
+    ' | ./w:hyperlink/w:r/w:br | ./w:hyperlink/w:r/w:cr | ./w:hyperlink/w:r/w:noBreakHyphen',
+    namespaces=W_NS)
+# 非文本元素对应的文字（w:br 另按换行类型处理）
+RUN_CONTENT_TEXT = {W + 'tab': '\t', W + 'ptab': '\t', W + 'cr': '\n', W + 'noBreakHyphen': '-'}
+BR = W + 'br'
+
+
+def _run_content_text(node):
+    """文本节点原样返回；w:br 只有文本换行（默认类型）记为换行，分页/分栏符为空串，与 python-docx 一致"""
+    if isinstance(node, str):
+        return node
+    if node.tag == BR:
+        return '\n' if node.get(W + 'type', 'textWrapping') == 'textWrapping' else ''
+    return RUN_CONTENT_TEXT[node.tag]
+
+
+def paragraph_text(p):
+    """拼接 w:p 元素的文本，与 python-docx 的 paragraph.text 一致（含超链接中的run）"""
+    return ''.join(map(_run_content_text, PARAGRAPH_TEXT_XPATH(p)))
+
+
+def read_paragraph_texts(doc):
+    """一次XPath遍历读取正文段落文本，等价于 [p.text for p in doc.paragraphs]"""
+    return tuple(paragraph_text(p) for p in BODY_PARAGRAPHS_XPATH(doc.element.body))
+
+
+def iter_document_futures(paths, max_workers=4):
+    """按输入顺序逐个产出 (路径, Future)，Future 的结果为 docx.Document。
+    后台线程最多预先打开 max_workers 个文档（zipfile 解压与XML解析期间会释放GIL），
+    已取走的文档不再被持有，内存占用不随文档数增长；打开失败的异常在调用方 result() 时抛出"""
+    path_iter = iter(paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque((path, executor.submit(docx.Document, path))
+                        for path in islice(path_iter, max_workers))
+        while pending:
+            path, future = pending.popleft()
+            next_path = next(path_iter, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(docx.Document, next_path)))
+            yield path, future
+
+
+def collect_doc_paths(args):
+    """命令行参数可以是docx文件或目录（目录下所有 *.docx）"""
+    paths = []
+    for arg in args:
+        arg_path = Path(arg)
+        paths.extend(sorted(arg_path.glob("*.docx")) if arg_path.is_dir() else [arg_path])
+    return [str(p) for p in paths]
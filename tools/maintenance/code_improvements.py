@@ -1,5 +1,8 @@
 # 代码完善建议 - extract_sections_with_ai.py
 
+from types import MappingProxyType
+from typing import Any, Mapping
+
 # 1. 添加缺失的 JSON 清理函数
 def _clean_json_content(json_str: str) -> str:
     """清理JSON字符串，移除常见的格式问题"""
@@ -19,11 +22,54 @@ def _clean_json_content(json_str: str) -> str:
     return json_str.strip()
 
 # 2. 统一返回值类型的修复建议
+
+# 标准空结果模板：模块加载时只分配一次，只读调用方直接共享只读视图
+_EMPTY_THEORETICAL = MappingProxyType({
+    'core_theories': (),
+    'theoretical_models': (),
+    'conceptual_foundations': (),
+    'theoretical_contributions': ()
+})
+
+_EMPTY_AUTHOR = MappingProxyType({
+    'contribution_statement': '',
+    'research_contributions': (),
+    'publication_contributions': (),
+    'innovation_points': ()
+})
+
+_EMPTY_MAIN_RESULT = MappingProxyType({
+    'thesis_number': '',
+    'title_cn': '',
+    'title_en': '',
+    'author_cn': '',
+    'author_en': '',
+    'supervisor': '',
+    'degree_type': '',
+    'major': '',
+    'submission_date': '',
+    'institution': '',
+    'abstract_cn': '',
+    'abstract_en': '',
+    'keywords_cn': '',
+    'keywords_en': '',
+    'references': ()
+})
+
+
+def _empty_result(template: Mapping[str, Any], mutable: bool) -> Mapping[str, Any]:
+    """按需返回模板：只读时返回共享视图，需要修改时展开为新的dict/list"""
+    if not mutable:
+        return template
+    return {key: list(value) if isinstance(value, tuple) else value
+            for key, value in template.items()}
+
+
 class ReturnValueFixes:
     """返回值一致性修复建议"""
     
     @staticmethod
-    def fix_theoretical_framework_return():
+    def fix_theoretical_framework_return(mutable: bool = True):
         """修复理论框架提取的返回值不一致问题"""
         # 将 _analyze_theoretical_framework_with_ai 的返回值统一为字典类型
         # 失败时返回标准空字典而不是 None
@@ -32,51 +78,23 @@ class ReturnValueFixes:
         # return None
         
         # 修复后：
-        return {
-            'core_theories': [],
-            'theoretical_models': [],
-            'conceptual_foundations': [],
-            'theoretical_contributions': []
-        }
+        return _empty_result(_EMPTY_THEORETICAL, mutable)
     
     @staticmethod
-    def fix_author_contributions_return():
+    def fix_author_contributions_return(mutable: bool = True):
         """修复作者贡献提取的返回值不一致问题"""
         # 修复前：
         # return None
         
         # 修复后：
-        return {
-            'contribution_statement': '',
-            'research_contributions': [],
-            'publication_contributions': [],
-            'innovation_points': []
-        }
+        return _empty_result(_EMPTY_AUTHOR, mutable)
     
     @staticmethod
-    def fix_main_extractor_return():
+    def fix_main_extractor_return(mutable: bool = True):
         """修复主提取方法的返回值"""
         # 为 extract_sections_with_pro_strategy 添加标准空结果返回
         # 失败时返回包含所有必需字段的空字典而不是 None
-        
-        standard_empty_result = {
-            'thesis_number': '',
-            'title_cn': '',
-            'title_en': '',
-            'author_cn': '',
-            'author_en': '',
-            'supervisor': '',
-            'degree_type': '',
-            'major': '',
-            'submission_date': '',
-            'institution': '',
-            'abstract_cn': '',
-            'abstract_en': '',
-            'keywords_cn': '',
-            'keywords_en': '',
-            'references': []
-        }
-        return standard_empty_result
+        return _empty_result(_EMPTY_MAIN_RESULT, mutable)
 
 # 3. 错误处理增强建议
 class ErrorHandlingImprovements:
@@ -7,12 +7,29 @@
 import os
 import re
 import json
+import time
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+@dataclass(slots=True, frozen=True)
 class ExtractionReport:
     """提取报告"""
     total_fields: int
@@ -20,12 +37,209 @@ class ExtractionReport:
     completeness: float
     confidence_score: float
     extraction_time: str
-    techniques_used: List[str]
+    techniques_used: Tuple[str, ...]
     quality_score: float
 
+
+@dataclass(slots=True)
+class _Doc:
+    """待提取文档：全文及各技术共用的切片、行列表和行偏移，只计算一次"""
+    content: str
+    lines: List[str]
+    line_starts: List[int]
+    front_15k: str
+    front_10k: str
+    front_5k: str
+    
+    @classmethod
+    def from_content(cls, content: str) -> '_Doc':
+        lines = content.split('\n')
+        line_starts = []
+        offset = 0
+        for line in lines:
+            line_starts.append(offset)
+            offset += len(line) + 1
+        return cls(
+            content=content,
+            lines=lines,
+            line_starts=line_starts,
+            front_15k=content[:15000],
+            front_10k=content[:10000],
+            front_5k=content[:5000]
+        )
+
+
+class _LazySection:
+    """章节定位结果：只记录行区间，content 在首次访问时才拼接"""
+    
+    def __init__(self, lines: List[str], start: int, end: int):
+        self.lines = lines
+        self.start = start
+        self.end = end
+    
+    @cached_property
+    def content(self) -> str:
+        return '\n'.join(self.lines[self.start:self.end])
+    
+    def __getitem__(self, key: str) -> Any:
+        # 兼容原先的 {'start', 'end', 'content'} 字典访问方式
+        if key not in ('start', 'end', 'content'):
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+# 缓存文档与输出目录，模块加载时解析一次
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_CACHE_DIR = _SCRIPT_DIR / "cache" / "documents"
+_OUT_DIR = _SCRIPT_DIR / "data" / "output"
+
+
+# 实验类研究方法的中文标志词（无大小写之分，无需 lower()）
+RESEARCH_METHOD_MARKERS = ('实验', '制备', '合成', '测试')
+
+# 标题片段：单行内有界重复，避免多个 [\w\s]* 串联时的灾难性回溯
+_TITLE_SPAN = r'[\w \t\u3000]{0,40}'
+
+
+def _build_marker_automaton(markers: Dict[str, Tuple[str, ...]]):
+    """将字面量标记构建为 Aho-Corasick 自动机；pyahocorasick 不可用时返回 None"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name, literals in markers.items():
+        for literal in literals:
+            automaton.add_word(literal, (name, len(literal)))
+    automaton.make_automaton()
+    return automaton
+
+
+# 去掉转义序列和分组名后再判断模式是否含英文字母
+_PATTERN_SYNTAX_RE = re.compile(r'\\u[0-9a-fA-F]{4}|\\.|\(\?P<\w+>|\(\?[:=!]')
+_ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+
+
+def _effective_flags(pattern: str, flags: int) -> int:
+    """纯中文模式不需要 IGNORECASE，去掉以免逐字符做 Unicode 大小写折叠"""
+    if flags & re.IGNORECASE and not _ASCII_LETTER_RE.search(_PATTERN_SYNTAX_RE.sub('', pattern)):
+        return flags & ~re.IGNORECASE
+    return flags
+
+
+def _compile_patterns(raw_patterns: Dict[str, List[str]], flags: int = 0) -> Dict[str, Tuple[re.Pattern, ...]]:
+    """将 {字段: [模式, ...]} 编译为 {字段: (已编译模式, ...)}"""
+    return {
+        name: tuple(re.compile(pattern, _effective_flags(pattern, flags)) for pattern in patterns)
+        for name, patterns in raw_patterns.items()
+    }
+
+
 class ComprehensiveThesisExtractor:
     """综合性学位论文信息提取器"""
     
+    # 关键章节标记：纯中文字面量直接用 str.find 定位
+    LITERAL_SECTION_MARKERS = {
+        'cover': ('学位论文', '论文题目', '申请人', '指导教师'),
+        'abstract_cn': ('中文摘要',),
+        'keywords': ('关键词',),
+        'references': ('参考文献',),
+        'acknowledgement': ('致谢',)
+    }
+    # 需要忽略大小写或含空白的标记（在全文上匹配，空白不跨行）
+    REGEX_SECTION_MARKERS = {
+        'abstract_cn': [r'摘[^\S\n]*要'],
+        'abstract_en': [r'abstract', r'english abstract'],
+        'keywords': [r'key[^\S\n]*words'],
+        'toc': [r'目[^\S\n]*录', r'contents'],
+        'references': [r'references'],
+        'acknowledgement': [r'acknowledgement']
+    }
+    # 字面量标记的多模式自动机（单次扫描定位全部标记）
+    SECTION_AUTOMATON = _build_marker_automaton(LITERAL_SECTION_MARKERS)
+    SECTION_ORDER = ('cover', 'abstract_cn', 'abstract_en', 'keywords', 'toc', 'references', 'acknowledgement')
+    # 正则标记合并为一个命名分组的交替式，单次线性扫描全文
+    SECTION_RE = re.compile(
+        '|'.join(f"(?P<{name}>{'|'.join(patterns)})" for name, patterns in REGEX_SECTION_MARKERS.items()),
+        re.IGNORECASE
+    )
+    
+    # 常见姓氏：捕获组命名为 cn_name 的模式在匹配后按首字过滤，避免在正则中逐位置测试大字符类
+    CHINESE_SURNAMES = frozenset('王李张刘陈杨黄周吴徐孙马朱胡林何郭罗高梁谢韩唐冯叶程蒋沈魏杜丁薛阎苗曹严陆')
+    
+    # 核心字段的增强模式
+    FRONT_MATTER_PATTERNS = _compile_patterns({
+        'ThesisNumber': [
+            r'(?:论文编号|编号|学位论文编号)[:：]\s*([A-Z0-9]+)',
+            r'([0-9]{10,}[A-Z0-9]*)'
+        ],
+        'ChineseTitle': [
+            rf'BiSbSe\d*基?{_TITLE_SPAN}的{_TITLE_SPAN}研究',
+            rf'{_TITLE_SPAN}热电{_TITLE_SPAN}材料{_TITLE_SPAN}研究',
+            rf'{_TITLE_SPAN}制备{_TITLE_SPAN}性能{_TITLE_SPAN}研究'
+        ],
+        'ChineseAuthor': [
+            r'(?:申请人|作者|姓名|学生)[:：]\s*(?P<cn_name>[A-Za-z\u4e00-\u9fff]{2,5})',
+            r'(?P<cn_name>[\u4e00-\u9fff][思宁明华东军建国强龙凤云海山川河湖]{1,2})'
+        ],
+        'EnglishAuthor': [
+            r'(?:candidate|author|student)[:：]\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
+            r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:ing|ang|ong|eng))'
+        ],
+        'ChineseUniversity': [
+            r'(北京航空航天大学)',
+            r'([^，。\n]*大学)',
+            r'培养单位[:：]\s*([^，。\n]+)'
+        ],
+        'DegreeLevel': [
+            r'(博士学位|硕士学位|学士学位)',
+            r'申请学位[:：]\s*(博士|硕士|学士)',
+            r'degree of\s*(doctor|master|bachelor)'
+        ],
+        'ChineseSupervisor': [
+            r'指导教师[:：]\s*(?P<cn_name>[A-Za-z\u4e00-\u9fff-]{2,5})',
+            r'([赵立东|李明华|张伟军])'
+        ]
+    }, re.IGNORECASE | re.MULTILINE)
+    
+    # 特殊字段的精确模式
+    SPECIAL_PATTERNS = _compile_patterns({
+        'DefenseDate': [
+            r'(\d{4}[-年]\s*\d{1,2}[-月]\s*\d{1,2}[日]?)',
+            r'答辩日期[:：]\s*([^\n]+)',
+            r'defense.*?(\d{4}[-/]\d{1,2}[-/]\d{1,2})'
+        ],
+        'ChineseMajor': [
+            r'专业[:：]\s*(材料[^，。\n]*)',
+            r'学科[:：]\s*(材料[^，。\n]*)',
+            r'(材料科学与工程|材料物理与化学)'
+        ],
+        'College': [
+            r'学院[:：]\s*([^，。\n]*学院)',
+            r'(材料科学与工程学院|物理学院)',
+            r'培养学院[:：]\s*([^，。\n]+)'
+        ]
+    }, re.IGNORECASE)
+    
+    # 标题修复模式
+    TITLE_FIX_PATTERNS = tuple(re.compile(pattern) for pattern in (
+        rf'BiSbSe\d*基?{_TITLE_SPAN}制备{_TITLE_SPAN}性能{_TITLE_SPAN}研究',
+        rf'{_TITLE_SPAN}热电{_TITLE_SPAN}材料{_TITLE_SPAN}研究'
+    ))
+    
+    CN_KEYWORDS_RE = re.compile(r'关键词[:：](.*?)(?:\n|$)')
+    EN_KEYWORDS_RE = re.compile(r'key\s*words?[:：](.*?)(?:\n|$)', re.IGNORECASE)
+    FIRST_REF_RE = re.compile(r'^[^\S\n]*\[[^\S\n]*1[^\S\n]*\]', re.MULTILINE)
+    # 单条参考文献：从行首编号到下一个行首编号（或区间末尾）
+    REF_ENTRY_RE = re.compile(
+        r'^[^\S\n]*\[[^\S\n]*\d+[^\S\n]*\].*?(?=^[^\S\n]*\[[^\S\n]*\d+[^\S\n]*\]|\Z)',
+        re.MULTILINE | re.DOTALL
+    )
+    REF_END_RE = re.compile(r'致谢|攻读.*学位.*期间|个人简历')
+    CJK_CHAR_RE = re.compile(r'[\u4e00-\u9fff]')
+    
+    # 固定的技术列表，使用情况以位掩码记录
+    TECHNIQUES = ('结构化分析', '快速定位', '正则匹配', '分步抽取', '参考文献解析', '智能推理', '结果修复')
+    TECHNIQUE_BITS = {name: 1 << i for i, name in enumerate(TECHNIQUES)}
+    
     def __init__(self):
         self.expected_fields = [
             'ThesisNumber', 'ChineseTitle', 'EnglishTitle',
@@ -44,7 +258,12 @@ class ComprehensiveThesisExtractor:
             'ProposedSolutions', 'ResearchConclusions',
             'ApplicationValue', 'ReferenceList'
         ]
-        self.techniques_used = []
+        self._tech_mask = 0
+    
+    @property
+    def techniques_used(self) -> List[str]:
+        """已使用的技术名称（按固定顺序）"""
+        return [name for i, name in enumerate(self.TECHNIQUES) if self._tech_mask >> i & 1]
     
     def extract_with_all_techniques(self, content: str) -> Dict[str, Any]:
         """使用所有技术进行综合提取"""
@@ -52,174 +271,127 @@ class ComprehensiveThesisExtractor:
         print("🎯 启动综合性学位论文信息提取")
         print(f"📊 文档长度: {len(content):,} 字符")
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         extracted_info = {}
+        doc = _Doc.from_content(content)
         
         # 技术1: 结构化分析
         print("\n🔍 技术1: 文档结构化分析")
-        sections = self._analyze_document_structure(content)
-        self.techniques_used.append("结构化分析")
+        sections = self._analyze_document_structure(doc)
+        self._tech_mask |= self.TECHNIQUE_BITS["结构化分析"]
         
         # 技术2: 快速定位前置信息
         print("\n📋 技术2: 快速定位前置信息")
-        front_info = self._extract_front_matter_info(content)
+        front_info = self._extract_front_matter_info(doc)
         extracted_info.update(front_info)
-        self.techniques_used.append("快速定位")
+        self._tech_mask |= self.TECHNIQUE_BITS["快速定位"]
         
         # 技术3: 正则表达式精确匹配
         print("\n🎯 技术3: 正则表达式精确匹配")
-        regex_info = self._extract_with_enhanced_patterns(content)
+        regex_info = self._extract_with_enhanced_patterns(doc)
         extracted_info.update(regex_info)
-        self.techniques_used.append("正则匹配")
+        self._tech_mask |= self.TECHNIQUE_BITS["正则匹配"]
         
         # 技术4: 分步内容提取
         print("\n📄 技术4: 分步内容提取")
         content_info = self._extract_structured_content(sections)
         extracted_info.update(content_info)
-        self.techniques_used.append("分步抽取")
+        self._tech_mask |= self.TECHNIQUE_BITS["分步抽取"]
         
         # 技术5: 参考文献精确解析
         print("\n📚 技术5: 参考文献精确解析")
-        references = self._extract_references_precisely(content)
+        references = self._extract_references_precisely(doc)
         if references:
             extracted_info['ReferenceList'] = references
             print(f"    提取参考文献: {len(references)} 条")
-        self.techniques_used.append("参考文献解析")
+        self._tech_mask |= self.TECHNIQUE_BITS["参考文献解析"]
         
         # 技术6: 智能推理补充
         print("\n🧠 技术6: 智能推理补充")
-        inferred_info = self._intelligent_inference(extracted_info, content)
+        inferred_info = self._intelligent_inference(extracted_info, doc)
         extracted_info.update(inferred_info)
-        self.techniques_used.append("智能推理")
+        self._tech_mask |= self.TECHNIQUE_BITS["智能推理"]
         
         # 技术7: 结果验证和修复
         print("\n🔧 技术7: 结果验证和修复")
-        extracted_info = self._validate_and_fix(extracted_info, content)
-        self.techniques_used.append("结果修复")
+        extracted_info = self._validate_and_fix(extracted_info, doc)
+        self._tech_mask |= self.TECHNIQUE_BITS["结果修复"]
         
         # 计算提取时间
-        extraction_time = (datetime.now() - start_time).total_seconds()
+        extraction_time = time.perf_counter() - start_time
         
         print(f"\n⏱️ 提取完成，耗时: {extraction_time:.2f} 秒")
         
         return extracted_info
     
-    def _analyze_document_structure(self, content: str) -> Dict[str, Any]:
+    def _analyze_document_structure(self, doc: _Doc) -> Dict[str, Any]:
         """分析文档结构"""
-        lines = content.split('\n')
+        content = doc.content
+        lines = doc.lines
         sections = {}
         
-        # 关键章节模式
-        section_patterns = {
-            'cover': [r'学位论文', r'论文题目', r'申请人', r'指导教师'],
-            'abstract_cn': [r'摘\s*要', r'中文摘要'],
-            'abstract_en': [r'abstract', r'english abstract'],
-            'keywords': [r'关键词', r'key\s*words'],
-            'toc': [r'目\s*录', r'contents'],
-            'references': [r'参考文献', r'references'],
-            'acknowledgement': [r'致谢', r'acknowledgement']
-        }
-        
-        for section_name, patterns in section_patterns.items():
-            for i, line in enumerate(lines):
-                line_clean = line.strip().lower()
-                
-                for pattern in patterns:
-                    if re.search(pattern, line_clean, re.IGNORECASE):
-                        end_line = min(i + 50, len(lines))  # 默认后50行
-                        
-                        sections[section_name] = {
-                            'start': i,
-                            'end': end_line,
-                            'content': '\n'.join(lines[i:end_line])
-                        }
+        # 记录每个章节标记的最早出现位置
+        first_pos = {}
+        if self.SECTION_AUTOMATON is not None:
+            for end_index, (section_name, length) in self.SECTION_AUTOMATON.iter(content):
+                if section_name not in first_pos:
+                    first_pos[section_name] = end_index - length + 1
+                    if len(first_pos) == len(self.LITERAL_SECTION_MARKERS):
                         break
-                
-                if section_name in sections:
-                    break
+        else:
+            for section_name, literals in self.LITERAL_SECTION_MARKERS.items():
+                for literal in literals:
+                    pos = content.find(literal)
+                    if pos != -1 and pos < first_pos.get(section_name, len(content)):
+                        first_pos[section_name] = pos
+        
+        # 正则标记：所有章节位置都已确定后立即停止扫描
+        pending = set(self.REGEX_SECTION_MARKERS)
+        for match in self.SECTION_RE.finditer(content):
+            section_name = match.lastgroup
+            if section_name in pending:
+                pending.discard(section_name)
+                if match.start() < first_pos.get(section_name, len(content)):
+                    first_pos[section_name] = match.start()
+            # 字面量已在当前位置之前定位到的章节，后续正则匹配不可能更早
+            pending = {name for name in pending if first_pos.get(name, len(content)) > match.start()}
+            if not pending:
+                break
+        
+        # 按原有章节顺序输出
+        for section_name in self.SECTION_ORDER:
+            if section_name not in first_pos:
+                continue
+            i = bisect_right(doc.line_starts, first_pos[section_name]) - 1
+            end_line = min(i + 50, len(lines))  # 默认后50行
+            sections[section_name] = _LazySection(lines, i, end_line)
         
         print(f"   📍 识别章节: {', '.join(sections.keys())}")
         return sections
     
-    def _extract_front_matter_info(self, content: str) -> Dict[str, Any]:
+    def _extract_front_matter_info(self, doc: _Doc) -> Dict[str, Any]:
         """从前置部分快速提取信息"""
-        front_matter = content[:15000]  # 前15k字符
+        front_matter = doc.front_15k  # 前15k字符
         info = {}
         
-        # 核心字段的增强模式
-        patterns = {
-            'ThesisNumber': [
-                r'(?:论文编号|编号|学位论文编号)[:：]\s*([A-Z0-9]+)',
-                r'([0-9]{10,}[A-Z0-9]*)'
-            ],
-            'ChineseTitle': [
-                r'BiSbSe[0-9]*[基]*[\w\s]*的[\w\s]*研究',
-                r'[\w\s]*热电[\w\s]*材料[\w\s]*研究',
-                r'[\w\s]*制备[\w\s]*性能[\w\s]*研究'
-            ],
-            'ChineseAuthor': [
-                r'(?:申请人|作者|姓名|学生)[:：]\s*([王李张刘陈杨黄周吴徐孙马朱胡林何郭罗高梁谢韩唐冯叶程蒋沈魏杜丁薛阎苗曹严陆][A-Za-z\u4e00-\u9fff]{1,4})',
-                r'([王李张刘陈杨黄周吴徐孙马朱胡林何郭罗高梁谢韩唐冯叶程蒋沈魏杜丁薛阎苗曹严陆][思宁明华东军建国强龙凤云海山川河湖]{1,2})'
-            ],
-            'EnglishAuthor': [
-                r'(?:candidate|author|student)[:：]\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-                r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:ing|ang|ong|eng))'
-            ],
-            'ChineseUniversity': [
-                r'(北京航空航天大学)',
-                r'([^，。\n]*大学)',
-                r'培养单位[:：]\s*([^，。\n]+)'
-            ],
-            'DegreeLevel': [
-                r'(博士学位|硕士学位|学士学位)',
-                r'申请学位[:：]\s*(博士|硕士|学士)',
-                r'degree of\s*(doctor|master|bachelor)'
-            ],
-            'ChineseSupervisor': [
-                r'指导教师[:：]\s*([王李张刘陈杨黄周吴徐孙马朱胡林何郭罗高梁谢韩唐冯叶程蒋沈魏杜丁薛阎苗曹严陆][A-Za-z\u4e00-\u9fff-]{1,4})',
-                r'([赵立东|李明华|张伟军])'
-            ]
-        }
-        
-        for field, field_patterns in patterns.items():
+        for field, field_patterns in self.FRONT_MATTER_PATTERNS.items():
             for pattern in field_patterns:
-                matches = re.findall(pattern, front_matter, re.IGNORECASE | re.MULTILINE)
-                if matches:
-                    # 选择最佳匹配
-                    best_match = self._select_best_match(matches, field)
-                    if best_match:
-                        info[field] = best_match
-                        print(f"    {field}: {best_match}")
-                        break
+                # 选择最佳匹配
+                best_match = self._select_best_match(pattern, front_matter, field)
+                if best_match:
+                    info[field] = best_match
+                    print(f"    {field}: {best_match}")
+                    break
         
         return info
     
-    def _extract_with_enhanced_patterns(self, content: str) -> Dict[str, Any]:
+    def _extract_with_enhanced_patterns(self, doc: _Doc) -> Dict[str, Any]:
         """使用增强的正则表达式模式"""
         info = {}
         
-        # 特殊字段的精确模式
-        special_patterns = {
-            'DefenseDate': [
-                r'(\d{4}[-年]\s*\d{1,2}[-月]\s*\d{1,2}[日]?)',
-                r'答辩日期[:：]\s*([^\n]+)',
-                r'defense.*?(\d{4}[-/]\d{1,2}[-/]\d{1,2})'
-            ],
-            'ChineseMajor': [
-                r'专业[:：]\s*(材料[^，。\n]*)',
-                r'学科[:：]\s*(材料[^，。\n]*)',
-                r'(材料科学与工程|材料物理与化学)'
-            ],
-            'College': [
-                r'学院[:：]\s*([^，。\n]*学院)',
-                r'(材料科学与工程学院|物理学院)',
-                r'培养学院[:：]\s*([^，。\n]+)'
-            ]
-        }
-        
-        for field, field_patterns in special_patterns.items():
+        for field, field_patterns in self.SPECIAL_PATTERNS.items():
             for pattern in field_patterns:
-                match = re.search(pattern, content[:10000], re.IGNORECASE)
+                match = pattern.search(doc.front_10k)
                 if match:
                     info[field] = match.group(1).strip()
                     print(f"    {field}: {info[field]}")
@@ -233,7 +405,7 @@ class ComprehensiveThesisExtractor:
         
         # 提取摘要
         if 'abstract_cn' in sections:
-            content = sections['abstract_cn']['content']
+            content = sections['abstract_cn'].content
             # 清理摘要
             lines = [line.strip() for line in content.split('\n') if line.strip()]
             # 跳过标题行
@@ -247,9 +419,9 @@ class ComprehensiveThesisExtractor:
         
         # 提取关键词
         if 'keywords' in sections:
-            content = sections['keywords']['content']
+            content = sections['keywords'].content
             # 查找中文关键词
-            cn_keywords = re.search(r'关键词[:：](.*?)(?:\n|$)', content, re.IGNORECASE)
+            cn_keywords = self.CN_KEYWORDS_RE.search(content)
             if cn_keywords:
                 keywords = cn_keywords.group(1).strip()
                 if keywords:
@@ -257,7 +429,7 @@ class ComprehensiveThesisExtractor:
                     print(f"    中文关键词: {keywords}")
             
             # 查找英文关键词
-            en_keywords = re.search(r'key\s*words?[:：](.*?)(?:\n|$)', content, re.IGNORECASE)
+            en_keywords = self.EN_KEYWORDS_RE.search(content)
             if en_keywords:
                 keywords = en_keywords.group(1).strip()
                 if keywords:
@@ -266,54 +438,32 @@ class ComprehensiveThesisExtractor:
         
         return info
     
-    def _extract_references_precisely(self, content: str) -> List[str]:
+    def _extract_references_precisely(self, doc: _Doc) -> List[str]:
         """精确提取参考文献"""
-        lines = content.split('\n')
+        content = doc.content
         
         # 找到参考文献开始
-        ref_start = None
-        for i, line in enumerate(lines):
-            if re.match(r'^\[\s*1\s*\]', line.strip()):
-                ref_start = i
-                break
-        
-        if not ref_start:
+        start_match = self.FIRST_REF_RE.search(content)
+        if not start_match:
             return []
-        
-        # 找到结束位置
-        ref_end = len(lines)
-        for i, line in enumerate(lines[ref_start:], ref_start):
-            if re.search(r'致谢|攻读.*学位.*期间|个人简历', line.strip()):
-                ref_end = i
-                break
-        
-        # 提取引用条目
-        ref_lines = lines[ref_start:ref_end]
-        references = []
-        current_ref = ""
-        
-        for line in ref_lines:
-            line = line.strip()
-            if re.match(r'^\[\s*\d+\s*\]', line):
-                if current_ref:
-                    references.append(' '.join(current_ref.split()))
-                current_ref = line
-            elif line and current_ref:
-                current_ref += " " + line
-        
-        if current_ref:
-            references.append(' '.join(current_ref.split()))
-        
-        # 过滤有效引用
-        valid_refs = []
-        for ref in references:
-            if 30 <= len(ref) <= 800:  # 合理长度
-                valid_refs.append(ref)
-        
-        return valid_refs
+        ref_start = start_match.start()
+        
+        # 找到结束位置（结束标记所在行的行首）
+        ref_end = len(content)
+        end_match = self.REF_END_RE.search(content, ref_start)
+        if end_match:
+            ref_end = content.rfind('\n', ref_start, end_match.start()) + 1 or ref_start
+        
+        # 单次扫描提取引用条目，规整空白后直接按合理长度过滤，不保留中间列表
+        normalized = (
+            ' '.join(match.group().split())
+            for match in self.REF_ENTRY_RE.finditer(content, ref_start, ref_end)
+        )
+        return [ref for ref in normalized if 30 <= len(ref) <= 800]
     
-    def _intelligent_inference(self, extracted_info: Dict[str, Any], content: str) -> Dict[str, Any]:
+    def _intelligent_inference(self, extracted_info: Dict[str, Any], doc: _Doc) -> Dict[str, Any]:
         """智能推理补充信息"""
+        content = doc.content
         inferred = {}
         
         # 推理英文信息
@@ -326,7 +476,7 @@ class ComprehensiveThesisExtractor:
         
         # 推理研究方法
         if not extracted_info.get('ResearchMethods'):
-            if any(kw in content.lower() for kw in ['实验', '制备', '合成', '测试']):
+            if any(kw in content for kw in RESEARCH_METHOD_MARKERS):
                 inferred['ResearchMethods'] = '实验研究方法'
         
         # 推理创新点
@@ -344,20 +494,16 @@ class ComprehensiveThesisExtractor:
         
         return inferred
     
-    def _validate_and_fix(self, extracted_info: Dict[str, Any], content: str) -> Dict[str, Any]:
+    def _validate_and_fix(self, extracted_info: Dict[str, Any], doc: _Doc) -> Dict[str, Any]:
         """验证和修复提取结果"""
+        content = doc.content
         
         # 修复标题问题
         title = extracted_info.get('ChineseTitle', '')
         if len(title) > 100 or '声明' in title or '本人' in title:
             # 重新查找标题
-            title_patterns = [
-                r'BiSbSe[0-9]*[基]*[\w\s]*制备[\w\s]*性能[\w\s]*研究',
-                r'[\w\s]*热电[\w\s]*材料[\w\s]*研究'
-            ]
-            
-            for pattern in title_patterns:
-                match = re.search(pattern, content[:5000])
+            for pattern in self.TITLE_FIX_PATTERNS:
+                match = pattern.search(doc.front_5k)
                 if match:
                     extracted_info['ChineseTitle'] = match.group()
                     print(f"   🔧 修复标题: {match.group()}")
@@ -375,48 +521,43 @@ class ComprehensiveThesisExtractor:
         
         # 修复导师信息
         supervisor = extracted_info.get('ChineseSupervisor', '')
-        if supervisor and not re.search(r'[\u4e00-\u9fff]', supervisor):
+        if supervisor and not self.CJK_CHAR_RE.search(supervisor):
             if 'Zhao Li-Dong' in supervisor or 'Li-Dong' in supervisor:
                 extracted_info['ChineseSupervisor'] = '赵立东'
                 print("   🔧 修复导师姓名: 赵立东")
         
         return extracted_info
     
-    def _select_best_match(self, matches: List[str], field_name: str) -> Optional[str]:
-        """选择最佳匹配结果"""
-        if not matches:
-            return None
-        
-        # 去重并过滤
-        unique_matches = []
-        for match in matches:
-            if isinstance(match, tuple):
-                match = match[0] if match[0] else (match[1] if len(match) > 1 else '')
-            match = match.strip()
-            if match and match not in unique_matches:
-                unique_matches.append(match)
-        
-        if not unique_matches:
-            return None
-        
-        if len(unique_matches) == 1:
-            return unique_matches[0]
-        
-        # 根据字段类型选择最佳匹配
-        if field_name in ['ChineseTitle', 'EnglishTitle']:
-            # 选择最合理长度的标题
-            for match in unique_matches:
-                if 10 <= len(match) <= 100:
-                    return match
-            return max(unique_matches, key=len)
-        
-        elif field_name in ['ChineseAuthor', 'EnglishAuthor']:
-            # 选择看起来最像人名的
-            for match in unique_matches:
-                if 2 <= len(match) <= 10:
-                    return match
-        
-        return unique_matches[0]
+    def _select_best_match(self, pattern: re.Pattern, text: str, field_name: str) -> Optional[str]:
+        """逐个扫描匹配并内联选择最佳结果，遇到满足条件的候选即返回"""
+        first = None
+        longest = None
+        filter_surname = 'cn_name' in pattern.groupindex
+        
+        for match in pattern.finditer(text):
+            candidate = (match.group(1) if pattern.groups else match.group()).strip()
+            if not candidate:
+                continue
+            if filter_surname and candidate[0] not in self.CHINESE_SURNAMES:
+                continue
+            
+            # 根据字段类型选择最佳匹配
+            if field_name in ('ChineseTitle', 'EnglishTitle'):
+                # 选择最合理长度的标题，否则取最长
+                if 10 <= len(candidate) <= 100:
+                    return candidate
+                if longest is None or len(candidate) > len(longest):
+                    longest = candidate
+            elif field_name in ('ChineseAuthor', 'EnglishAuthor'):
+                # 选择看起来最像人名的，否则取第一个
+                if 2 <= len(candidate) <= 10:
+                    return candidate
+                if first is None:
+                    first = candidate
+            else:
+                return candidate
+        
+        return longest if longest is not None else first
     
     def generate_report(self, extracted_info: Dict[str, Any]) -> ExtractionReport:
         """生成提取报告"""
@@ -446,7 +587,7 @@ class ComprehensiveThesisExtractor:
             completeness=completeness,
             confidence_score=confidence,
             extraction_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            techniques_used=self.techniques_used.copy(),
+            techniques_used=tuple(self.techniques_used),
             quality_score=quality_score
         )
 
@@ -458,7 +599,7 @@ def comprehensive_extraction(file_path: str) -> Dict[str, Any]:
     print("=" * 60)
     
     # 读取文档
-    md_file = Path(__file__).parent / "cache" / "documents" / "51177_b6ac1c475108811bd4a31a6ebcd397df.md"
+    md_file = _CACHE_DIR / "51177_b6ac1c475108811bd4a31a6ebcd397df.md"
     
     try:
         with open(md_file, 'r', encoding='utf-8') as f:
@@ -475,9 +616,13 @@ def comprehensive_extraction(file_path: str) -> Dict[str, Any]:
     report = extractor.generate_report(extracted_info)
     
     # 保存结果
-    output_file = Path(__file__).parent / "data" / "output" / "51177_comprehensive_extracted_info.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(extracted_info, f, ensure_ascii=False, indent=2)
+    output_file = _OUT_DIR / "51177_comprehensive_extracted_info.json"
+    if ORJSON_AVAILABLE:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(extracted_info, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(extracted_info, f, ensure_ascii=False, indent=2)
     
     # 显示最终报告
     print("\n" + "=" * 60)
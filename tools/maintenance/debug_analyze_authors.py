@@ -2,19 +2,18 @@
 # -*- coding: utf-8 -*-
 
 import json
+import re
+
+# 明显的机构关键词
+INSTITUTION_KEYWORDS = ['University', 'Department', 'College', 'Institute', 'Hospital', 
+                        'Center', 'School', 'Laboratory', 'Research', 'Medical', 
+                        'Electronic address', 'USA', 'China', 'Dept.']
+INSTITUTION_RE = re.compile('|'.join(map(re.escape, INSTITUTION_KEYWORDS)), re.IGNORECASE)
 
 def is_valid_author_name(name: str) -> bool:
     """判断是否为有效的作者姓名（过滤掉机构名称）"""
-    if not name or len(name) > 50:  # 过滤掉过长的名称
-        return False
-    # 过滤掉明显的机构关键词
-    institution_keywords = ['University', 'Department', 'College', 'Institute', 'Hospital', 
-                          'Center', 'School', 'Laboratory', 'Research', 'Medical', 
-                          'Electronic address', 'USA', 'China', 'Dept.']
-    name_lower = name.lower()
-    if any(keyword.lower() in name_lower for keyword in institution_keywords):
-        return False
-    return True
+    # 过滤掉过长的名称和包含机构关键词的名称
+    return bool(name) and len(name) <= 50 and INSTITUTION_RE.search(name) is None
 
 # 读取中文文献数据
 chinese_path = r"f:\MyProjects\thesis_Inno_Eval\data\output\15-基于风险管理视角的互联网医院政策文本量化分析与优化路径研究_relevant_papers_dedup_Chinese.json"
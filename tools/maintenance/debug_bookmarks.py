@@ -5,8 +5,14 @@
 """
 
 from src.thesis_inno_eval.ai_toc_extractor import AITocExtractor
-import docx
 import re
+import zipfile
+from bisect import bisect_right
+
+# 查找所有TOC书签 - 简化正则表达式
+BOOKMARK_RE = re.compile(r'<w:bookmarkStart[^>]*w:name="(_Toc\d+)"[^>]*/>')
+# 从XML中提取文本内容
+TEXT_RE = re.compile(r'<w:t[^>]*>(.*?)</w:t>', re.DOTALL)
 
 def debug_bookmark_extraction():
     print('🔍 详细分析50193.docx所有书签内容')
@@ -14,12 +20,12 @@ def debug_bookmark_extraction():
 
     # 读取文档
     doc_path = 'data/input/50193.docx'
-    document = docx.Document(doc_path)
-    document_xml = document._element.xml
+    # 直接读取 word/document.xml，跳过 python-docx 解析和重新序列化；
+    # 先整体解码再匹配，位置和片段窗口都按字符计
+    with zipfile.ZipFile(doc_path) as docx_zip:
+        document_xml = docx_zip.read('word/document.xml').decode('utf-8')
 
-    # 查找所有TOC书签 - 简化正则表达式
-    bookmark_pattern = r'<w:bookmarkStart[^>]*w:name="(_Toc\d+)"[^>]*/>'
-    bookmark_starts = re.finditer(bookmark_pattern, document_xml)
+    bookmark_starts = BOOKMARK_RE.finditer(document_xml)
 
     bookmark_positions = []
 
@@ -37,20 +43,21 @@ def debug_bookmark_extraction():
     conclusion_found = False
     author_found = False
 
-    for i, (bookmark_name, start_pos) in enumerate(bookmark_positions):
-        # 确定提取文本的结束位置
-        if i + 1 < len(bookmark_positions):
-            end_pos = bookmark_positions[i + 1][1]
-        else:
-            end_pos = start_pos + 2000
-        
-        # 提取书签后的XML片段
-        xml_fragment = document_xml[start_pos:end_pos]
-        
-        # 从XML中提取文本内容
-        text_pattern = r'<w:t[^>]*>(.*?)</w:t>'
-        text_matches = re.findall(text_pattern, xml_fragment, re.DOTALL)
-        
+    # 书签片段边界：到下一个书签为止，最后一个书签取后2000字符
+    starts = [pos for _, pos in bookmark_positions]
+    ends = starts[1:] + [starts[-1] + 2000] if starts else []
+    
+    # 单次扫描全文文本节点，按位置归入所属书签
+    fragment_texts = [[] for _ in bookmark_positions]
+    if starts:
+        for match in TEXT_RE.finditer(document_xml, starts[0]):
+            i = bisect_right(starts, match.start()) - 1
+            if match.end() <= ends[i]:
+                fragment_texts[i].append(match.group(1))
+            elif i == len(starts) - 1:
+                break
+    
+    for (bookmark_name, start_pos), text_matches in zip(bookmark_positions, fragment_texts):
         if text_matches:
             text_parts = []
             for text in text_matches:
@@ -11,6 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 from thesis_inno_eval.ai_toc_extractor import AITocExtractor, detect_non_chinese_content
 import docx
 import logging
+import numpy as np
 
 # 设置日志
 logging.basicConfig(
@@ -18,6 +19,11 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+def count_chinese_chars(content):
+    """统计CJK基本区汉字数量（按UTF-32码点向量化比较）"""
+    codepoints = np.frombuffer(content.encode('utf-32-le'), dtype=np.uint32)
+    return int(((codepoints >= 0x4E00) & (codepoints <= 0x9FFF)).sum())
+
 def analyze_chinese_content(file_path):
     """分析文档中文内容"""
     print(f"分析文件: {file_path}")
@@ -25,17 +31,13 @@ def analyze_chinese_content(file_path):
     # 读取文档内容
     try:
         doc = docx.Document(file_path)
-        content = ""
-        for paragraph in doc.paragraphs:
-            content += paragraph.text + "\n"
+        # 一次性拼接，避免逐段 += 造成的反复复制
+        content = "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
             
         print(f"文档总字符数: {len(content)}")
         
         # 检查中文字符
-        chinese_chars = 0
-        for char in content:
-            if '\u4e00' <= char <= '\u9fff':
-                chinese_chars += 1
+        chinese_chars = count_chinese_chars(content)
         
         chinese_ratio = chinese_chars / len(content) if len(content) > 0 else 0
         print(f"中文字符数: {chinese_chars}")
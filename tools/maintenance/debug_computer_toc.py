@@ -6,24 +6,92 @@
 
 import sys
 import os
+import hashlib
+import inspect
+import pickle
+import traceback
+from functools import lru_cache
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.thesis_inno_eval.ai_toc_extractor import AITocExtractor
+from _debug_cache import PROJECT_ROOT, write_pickle_atomic
+from _debug_docx import collect_doc_paths, iter_document_futures, read_paragraph_texts
 import docx
+import re
 
-def debug_computer_thesis_toc():
+# 设置 DEBUG_VERBOSE=1 时才输出完整堆栈
+VERBOSE = os.environ.get('DEBUG_VERBOSE') == '1'
+# 设置 DEBUG_NO_CACHE=1 时跳过目录提取缓存，每次都重新运行提取器
+NO_CACHE = os.environ.get('DEBUG_NO_CACHE') == '1'
+
+# 目录特征：章标题、常见小节编号、前后置部分标题
+TOC_FEATURE_RE = re.compile(r'第[一二三四五六七]章|1\.[12]|2\.[12]|[3-7]\.1|摘要|Abstract|目录|参考文献|致谢|攻读')
+# 页码结尾：罗马数字(I-X) 或 1-99 的阿拉伯数字
+PAGE_END_RE = re.compile(r'(?:[IVX1-9]|[1-9]0)\Z')
+# 期望出现在目录中的章节关键词（按优先级排列，一个条目只记第一个命中的关键词）
+EXPECTED_CHAPTERS = (
+    "第一章", "第二章", "第三章", "第四章", "第五章", "第六章", "第七章",
+    "绪论", "相关理论", "MLP", "SepCNN", "对比实验", "系统设计", "总结"
+)
+
+# 目录提取结果缓存（按提取器源码版本 + 文档内容SHA-256），目录固定在项目根目录下
+TOC_CACHE_DIR = PROJECT_ROOT / "cache" / "toc"
+
+def _file_sha256(file_path):
+    """计算文件内容的SHA-256"""
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+@lru_cache(maxsize=1)
+def _extractor_version():
+    """提取器模块源码的SHA-256：修改提取器后旧的缓存自动失效"""
+    return _file_sha256(inspect.getsourcefile(AITocExtractor))[:16]
+
+@lru_cache(maxsize=256)
+def _extract_toc_by_hash(doc_path, cache_key):
+    """按缓存键缓存 extract_toc 结果，进程内 LRU + 磁盘 pickle"""
+    cache_file = TOC_CACHE_DIR / f"{cache_key}.pkl"
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                cached_key, toc = pickle.load(f)
+            # 校验完整键，防止缓存文件损坏或误命中
+            if cached_key == cache_key:
+                print(f"💾 使用缓存的目录提取结果: {cache_file}")
+                return toc
+        except Exception as e:
+            print(f"⚠️ 读取目录缓存失败，重新提取: {e}")
+    
+    toc = AITocExtractor().extract_toc(doc_path)
+    try:
+        write_pickle_atomic(cache_file, (cache_key, toc))
+    except OSError as e:
+        print(f"⚠️ 写入目录缓存失败: {e}")
+    return toc
+
+def extract_toc_cached(doc_path):
+    """带缓存的目录提取：提取器源码与文档内容都不变时直接复用上次结果"""
+    if NO_CACHE:
+        return AITocExtractor().extract_toc(doc_path)
+    return _extract_toc_by_hash(doc_path, f"{_extractor_version()}_{_file_sha256(doc_path)}")
+
+DEFAULT_DOC_PATH = r"c:\MyProjects\thesis_Inno_Eval\data\input\1_计算机应用技术_17211204005-苏慧婧-基于MLP和SepCNN模型的藏文文本分类研究与实现-计算机应用技术-群诺.docx"
+
+def debug_computer_thesis_toc(doc_path=DEFAULT_DOC_PATH, doc=None):
     """调试计算机应用技术论文目录提取"""
     print("🔧 调试计算机应用技术论文目录提取")
     print("=" * 80)
     
-    doc_path = r"c:\MyProjects\thesis_Inno_Eval\data\input\1_计算机应用技术_17211204005-苏慧婧-基于MLP和SepCNN模型的藏文文本分类研究与实现-计算机应用技术-群诺.docx"
-    
     # 1. 先检查原始文档内容，找到真正的目录
     print("\n📄 步骤1：检查原始文档内容，寻找目录")
     print("-" * 60)
     
-    doc = docx.Document(doc_path)
-    lines = [p.text for p in doc.paragraphs]
+    if doc is None:
+        doc = docx.Document(doc_path)
+    lines = read_paragraph_texts(doc)
     
     # 寻找包含"第一章"、"1.1"等目录特征的区域
     potential_toc_lines = []
@@ -32,16 +100,9 @@ def debug_computer_thesis_toc():
         if not line:
             continue
             
-        # 检查是否包含目录特征
-        if any(pattern in line for pattern in [
-            "第一章", "第二章", "第三章", "第四章", "第五章", "第六章", "第七章",
-            "1.1", "1.2", "2.1", "2.2", "3.1", "4.1", "5.1", "6.1", "7.1",
-            "摘要", "Abstract", "目录", "参考文献", "致谢", "攻读"
-        ]):
-            # 检查是否包含页码（数字结尾）
-            if line.endswith(('I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X')) or \
-               any(line.endswith(str(j)) for j in range(1, 100)):
-                potential_toc_lines.append((i, line))
+        # 检查是否包含目录特征，且以页码结尾
+        if TOC_FEATURE_RE.search(line) and PAGE_END_RE.search(line):
+            potential_toc_lines.append((i, line))
     
     if potential_toc_lines:
         print(f"🔍 找到 {len(potential_toc_lines)} 行潜在目录内容：")
@@ -58,8 +119,7 @@ def debug_computer_thesis_toc():
     print("-" * 60)
     
     try:
-        extractor = AITocExtractor()
-        result = extractor.extract_toc(doc_path)
+        result = extract_toc_cached(doc_path)
         
         print(f" 提取成功")
         print(f"📊 提取条目数: {len(result.entries)}")
@@ -75,31 +135,25 @@ def debug_computer_thesis_toc():
             else:
                 print(f"      页码: None | 级别: {entry.level}")
                 
-        # 检查是否包含期望的章节
-        expected_chapters = [
-            "第一章", "第二章", "第三章", "第四章", "第五章", "第六章", "第七章",
-            "绪论", "相关理论", "MLP", "SepCNN", "对比实验", "系统设计", "总结"
-        ]
-        
+        # 检查是否包含期望的章节：按关键词列表顺序取第一个出现在标题中的关键词
         print(f"\n🎯 期望章节检查：")
-        found_chapters = []
+        found_chapters = set()
         for entry in result.entries:
-            for expected in expected_chapters:
-                if expected in entry.title:
-                    found_chapters.append(expected)
-                    print(f"   找到: {expected} -> {entry.title}")
-                    break
+            expected = next((ch for ch in EXPECTED_CHAPTERS if ch in entry.title), None)
+            if expected:
+                found_chapters.add(expected)
+                print(f"   找到: {expected} -> {entry.title}")
         
-        missing_chapters = [ch for ch in expected_chapters if ch not in found_chapters]
+        missing_chapters = [ch for ch in EXPECTED_CHAPTERS if ch not in found_chapters]
         if missing_chapters:
             print(f"\n❌ 缺失的期望章节: {', '.join(missing_chapters)}")
         else:
             print(f"\n🎉 所有期望章节都已找到！")
             
     except Exception as e:
-        print(f"❌ 提取失败: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ 提取失败: {type(e).__name__}: {e}")
+        if VERBOSE:
+            print(traceback.format_exc())
     
     # 3. 手动分析目录边界
     print(f"\n📄 步骤3：手动分析目录边界")
@@ -114,8 +168,8 @@ def debug_computer_thesis_toc():
             
             # 显示目录标题后的内容
             print(f"📄 目录标题后的内容：")
-            for j in range(i+1, min(i+21, len(lines))):
-                content = lines[j].strip()
+            for j, content in enumerate(lines[i+1:i+21], start=i+1):
+                content = content.strip()
                 if content:
                     print(f"  第{j+1:3d}行: {content}")
             break
@@ -131,8 +185,8 @@ def debug_computer_thesis_toc():
                 # 向前查找可能的目录区域
                 print(f"📄 正文开始前的内容：")
                 start_search = max(0, i-30)
-                for j in range(start_search, i):
-                    content = lines[j].strip()
+                for j, content in enumerate(lines[start_search:i], start=start_search):
+                    content = content.strip()
                     if content and any(pattern in content for pattern in ["第", "章", "1.", "2.", "摘要", "Abstract"]):
                         print(f"  第{j+1:3d}行: {content}")
                 break
@@ -141,5 +195,18 @@ def debug_computer_thesis_toc():
     print("🏁 调试完成")
 
 if __name__ == "__main__":
-    debug_computer_thesis_toc()
-
+    if len(sys.argv) > 1:
+        doc_paths = collect_doc_paths(sys.argv[1:])
+        if not doc_paths:
+            print(f"❌ 未找到docx文档: {' '.join(sys.argv[1:])}")
+            sys.exit(1)
+        # 批量调试：后台预先打开后续文档，逐个输出调试信息；单个文档打不开不影响其余文档
+        for doc_path, future in iter_document_futures(doc_paths):
+            try:
+                doc = future.result()
+            except Exception as e:
+                print(f"❌ 打开文档失败: {doc_path} - {type(e).__name__}: {e}")
+                continue
+            debug_computer_thesis_toc(doc_path, doc)
+    else:
+        debug_computer_thesis_toc()
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
+from operator import methodcaller
+
+from _debug_cache import flatten_authors, load_papers
 
 # 读取中文文献数据
 chinese_path = r"f:\MyProjects\thesis_Inno_Eval\data\output\15-基于风险管理视角的互联网医院政策文本量化分析与优化路径研究_relevant_papers_dedup_Chinese.json"
 
-with open(chinese_path, 'r', encoding='utf-8') as f:
-    chinese_papers = json.load(f)
+chinese_papers = load_papers(chinese_path)
 
 print("检查 corresponding 字段值:")
 for i, paper in enumerate(chinese_papers[:5]):
@@ -24,13 +25,12 @@ for i, paper in enumerate(chinese_papers[:5]):
             print(f"    corresponding is True: {corresponding is True}")
 
 print("\n=== 统计 corresponding 字段的所有可能值 ===")
-corresponding_values = set()
-for paper in chinese_papers:
-    authors = paper.get('Authors', [])
-    for author_info in authors:
-        if isinstance(author_info, dict):
-            corresponding = author_info.get('corresponding', None)
-            corresponding_values.add((str(corresponding), type(corresponding).__name__))
+# 作者先展开为扁平结构，再一次取出 corresponding 列；保留原始类型以便排查 bool/str 混用
+get_corresponding = methodcaller('get', 'corresponding')
+corresponding_values = {
+    (str(corresponding), type(corresponding).__name__)
+    for corresponding in map(get_corresponding, flatten_authors(chinese_papers))
+}
 
 for value, type_name in sorted(corresponding_values):
     print(f"值: {value} (类型: {type_name})")
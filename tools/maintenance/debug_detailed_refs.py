@@ -6,6 +6,10 @@
 import re
 from pathlib import Path
 
+# 全角括号编号的参考文献条目（MULTILINE 下 $ 匹配行尾，条目止于行尾）
+REF_RE = re.compile(r'［\s*(\d+)\s*］([\s\S]*?)(?=［\s*\d+\s*］|$)', re.MULTILINE | re.DOTALL)
+WS_RE = re.compile(r'\s+')
+
 def debug_detailed_extraction():
     """详细调试参考文献提取过程"""
     
@@ -29,31 +33,34 @@ def debug_detailed_extraction():
         
         print(f"📄 参考文献部分长度: {len(ref_text)} 字符")
         
-        # 测试修复后的模式
-        pattern = r'［\s*(\d+)\s*］([\s\S]*?)(?=［\s*\d+\s*］|$)'
-        matches = re.findall(pattern, ref_text, re.MULTILINE | re.DOTALL)
+        # 测试修复后的模式：逐个迭代匹配，只保留前5条用于展示
+        match_count = 0
+        preview_matches = []
+        for match in REF_RE.finditer(ref_text):
+            match_count += 1
+            if len(preview_matches) < 5:  # 只看前5条
+                preview_matches.append(match)
         
-        print(f"\n🔍 全角括号模式匹配结果: {len(matches)} 条")
+        print(f"\n🔍 全角括号模式匹配结果: {match_count} 条")
         
         references = []
-        for i, match in enumerate(matches[:5]):  # 只看前5条
-            if isinstance(match, tuple) and len(match) >= 2:
-                ref_num, ref_content = match[0], match[1]
-                ref = f"［{ref_num}］ {ref_content.strip()}"
-                
-                print(f"\n匹配 {i+1}:")
-                print(f"   编号: {ref_num}")
-                print(f"   内容长度: {len(ref_content)} 字符")
-                print(f"   内容预览: {ref_content[:200].replace(chr(10), ' ')}")
-                print(f"   完整引用长度: {len(ref)} 字符")
-                
-                # 应用过滤条件
-                if len(ref) > 20:
-                    ref = re.sub(r'\s+', ' ', ref).strip()
-                    references.append(ref)
-                    print(f"    通过过滤，最终长度: {len(ref)} 字符")
-                else:
-                    print(f"   ❌ 被过滤：长度 {len(ref)} <= 20")
+        for i, match in enumerate(preview_matches):
+            ref_num, ref_content = match.group(1), match.group(2)
+            ref = f"［{ref_num}］ {ref_content.strip()}"
+            
+            print(f"\n匹配 {i+1}:")
+            print(f"   编号: {ref_num}")
+            print(f"   内容长度: {len(ref_content)} 字符")
+            print(f"   内容预览: {ref_content[:200].replace(chr(10), ' ')}")
+            print(f"   完整引用长度: {len(ref)} 字符")
+            
+            # 应用过滤条件
+            if len(ref) > 20:
+                ref = WS_RE.sub(' ', ref).strip()
+                references.append(ref)
+                print(f"    通过过滤，最终长度: {len(ref)} 字符")
+            else:
+                print(f"   ❌ 被过滤：长度 {len(ref)} <= 20")
         
         print(f"\n📊 最终提取结果: {len(references)} 条")
         
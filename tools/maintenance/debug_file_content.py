@@ -26,9 +26,8 @@ def import_and_inspect():
     try:
         from thesis_inno_eval.extract_sections_with_gemini import extract_sections_with_gemini
         
-        # 获取函数源代码
-        source = inspect.getsource(extract_sections_with_gemini)
-        lines = source.split('\n')
+        # 获取函数源代码（inspect 内部经由 linecache 读取，重复调用命中内存）
+        lines, _ = inspect.getsourcelines(extract_sections_with_gemini)
         
         for i, line in enumerate(lines):
             if 'prompt = f"""' in line or '请从' in line:
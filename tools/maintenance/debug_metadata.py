@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 """调试元数据分析问题"""
 
-import json
 import sys
 import os
+from operator import methodcaller
+
+from _debug_cache import flatten_authors, load_papers
 
 def debug_metadata():
     try:
         # 读取中文文献数据
         chinese_file = "data/output/15-基于风险管理视角的互联网医院政策文本量化分析与优化路径研究_relevant_papers_dedup_Chinese.json"
-        with open(chinese_file, 'r', encoding='utf-8') as f:
-            chinese_papers = json.load(f)
+        chinese_papers = load_papers(chinese_file)
         
         print(f"中文文献数量: {len(chinese_papers)}")
         
@@ -23,26 +24,19 @@ def debug_metadata():
             print(f"Affiliations字段: {paper.get('Affiliations', 'Not found')}")
             print(f"Metrics字段: {paper.get('Metrics', 'Not found')}")
         
-        # 统计有作者信息的论文数量
-        papers_with_authors = 0
-        papers_with_affiliations = 0
-        papers_with_metrics = 0
+        # 统计有作者信息的论文数量：按列取出字段后逐列计数
+        authors_col = map(methodcaller('get', 'Authors'), chinese_papers)
+        affiliations_col = map(methodcaller('get', 'Affiliations'), chinese_papers)
+        metrics_col = map(methodcaller('get', 'Metrics'), chinese_papers)
         
-        for paper in chinese_papers:
-            authors = paper.get('Authors', [])
-            if authors and isinstance(authors, list) and len(authors) > 0:
-                papers_with_authors += 1
-                
-            affiliations = paper.get('Affiliations', [])
-            if affiliations and isinstance(affiliations, list) and len(affiliations) > 0:
-                papers_with_affiliations += 1
-                
-            metrics = paper.get('Metrics', {})
-            if metrics and isinstance(metrics, dict) and any(metrics.values()):
-                papers_with_metrics += 1
+        papers_with_authors = sum(1 for v in authors_col if isinstance(v, list) and v)
+        papers_with_affiliations = sum(1 for v in affiliations_col if isinstance(v, list) and v)
+        papers_with_metrics = sum(1 for v in metrics_col if isinstance(v, dict) and any(v.values()))
+        all_authors = flatten_authors(chinese_papers)
         
         print(f"\n统计结果:")
         print(f"有作者信息的论文: {papers_with_authors}")
+        print(f"作者条目总数: {len(all_authors)}")
         print(f"有机构信息的论文: {papers_with_affiliations}")
         print(f"有指标信息的论文: {papers_with_metrics}")
         
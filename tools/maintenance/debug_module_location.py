@@ -23,14 +23,13 @@ def debug_module_location():
     print("函数代码文件:", func.__code__.co_filename)
     print("函数代码行号:", func.__code__.co_firstlineno)
     
-    # 尝试读取实际的函数源代码
+    # 尝试读取实际的函数源代码（inspect 内部经由 linecache 读取，只到函数结尾）
     import inspect
     try:
-        source = inspect.getsource(func)
+        lines, start = inspect.getsourcelines(func)
         print("=== 函数源代码 ===")
-        lines = source.split('\n')
-        for i, line in enumerate(lines[:50], func.__code__.co_firstlineno):
-            print(f"{i:3d}: {line}")
+        for i, line in enumerate(lines[:50], start):
+            print(f"{i:3d}: {line.rstrip(chr(10))}")
         print("=== 源代码结束 ===")
     except Exception as e:
         print(f"无法获取源代码: {e}")
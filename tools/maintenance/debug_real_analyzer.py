@@ -5,7 +5,7 @@ import sys
 sys.path.append(r'f:\MyProjects\thesis_Inno_Eval\src')
 
 from thesis_inno_eval.literature_review_analyzer import LiteratureReviewAnalyzer
-import json
+from _debug_cache import load_papers
 
 # 创建分析器实例
 analyzer = LiteratureReviewAnalyzer()
@@ -14,11 +14,9 @@ analyzer = LiteratureReviewAnalyzer()
 chinese_path = r"f:\MyProjects\thesis_Inno_Eval\data\output\15-基于风险管理视角的互联网医院政策文本量化分析与优化路径研究_relevant_papers_dedup_Chinese.json"
 english_path = r"f:\MyProjects\thesis_Inno_Eval\data\output\15-基于风险管理视角的互联网医院政策文本量化分析与优化路径研究_relevant_papers_dedup_English.json"
 
-with open(chinese_path, 'r', encoding='utf-8') as f:
-    chinese_papers = json.load(f)
+chinese_papers = load_papers(chinese_path)
 
-with open(english_path, 'r', encoding='utf-8') as f:
-    english_papers = json.load(f)
+english_papers = load_papers(english_path)
 
 # 合并数据
 all_papers = chinese_papers + english_papers
@@ -6,6 +6,32 @@
 import re
 from pathlib import Path
 
+# 参考文献部分的结束标记（出现在任意行内即视为结束）
+END_MARKERS = ('缩略词表', '文献综述', '致谢', 'ACKNOWLEDGMENT', 'APPENDIX', '附录', '作者简介', '个人简历')
+END_RE = re.compile('|'.join(map(re.escape, END_MARKERS)))
+
+# 参考文献条目解析模式（按顺序尝试，首个有匹配的模式即采用）
+REF_ENTRY_PATTERNS = tuple(
+    (re.compile(pattern, re.MULTILINE | re.DOTALL), desc)
+    for pattern, desc in (
+        (r'\[(\d+)\]\s*([^\[]+?)(?=\[\d+\]|$)', '[数字]格式'),
+        (r'^\[(\d+)\]\s*([^\n]+)', '行首[数字]格式'),
+        (r'［(\d+)］\s*([^［]+?)(?=［\d+］|$)', '［数字］格式'),
+    )
+)
+
+# 参考文献部分定位模式（按顺序尝试，首个有匹配的模式即采用）
+REF_SECTION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r'参考文献\s*([\s\S]*?)(?=\n\s*(?:缩略词表|文献综述|致谢|附录)|$)',
+        r'参考文献\s*\n([\s\S]*?)(?=\n\s*(?:缩略词表|文献综述|致谢|附录)|$)',
+        r'REFERENCES?\s*([\s\S]*?)(?=\n\s*(?:ACKNOWLEDGMENT|APPENDIX|文献综述)|$)',
+        r'REFERENCES?\s*\n([\s\S]*?)(?=\n\s*(?:ACKNOWLEDGMENT|APPENDIX|文献综述)|$)',
+        r'Bibliography\s*([\s\S]*?)(?=\n\s*(?:ACKNOWLEDGMENT|APPENDIX|文献综述)|$)',
+    )
+)
+
 def debug_references_extraction():
     """调试参考文献提取问题"""
     # 读取缓存的markdown文件
@@ -37,20 +63,14 @@ def debug_references_extraction():
         print(f"   上下文: {pos['context']}")
         print()
     
-    # 测试当前的正则表达式模式
-    ref_patterns = [
-        r'参考文献\s*([\s\S]*?)(?=\n\s*(?:缩略词表|文献综述|致谢|附录)|$)',
-        r'参考文献\s*\n([\s\S]*?)(?=\n\s*(?:缩略词表|文献综述|致谢|附录)|$)',
-        r'REFERENCES?\s*([\s\S]*?)(?=\n\s*(?:ACKNOWLEDGMENT|APPENDIX|文献综述)|$)',
-        r'REFERENCES?\s*\n([\s\S]*?)(?=\n\s*(?:ACKNOWLEDGMENT|APPENDIX|文献综述)|$)',
-        r'Bibliography\s*([\s\S]*?)(?=\n\s*(?:ACKNOWLEDGMENT|APPENDIX|文献综述)|$)',
-    ]
-    
+    # 测试当前的正则表达式模式：每个模式只扫描一次全文，首个有匹配的模式即采用
     print("🧪 测试正则表达式模式:")
-    for i, pattern in enumerate(ref_patterns):
-        print(f"\n模式 {i+1}: {pattern}")
-        matches = list(re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE))
+    for i, pattern in enumerate(REF_SECTION_PATTERNS):
+        print(f"\n模式 {i+1}: {pattern.pattern}")
+        matches = list(pattern.finditer(text))
         print(f"   匹配数量: {len(matches)}")
+        if not matches:
+            continue
         
         for j, match in enumerate(matches):
             ref_text = match.group(1).strip()
@@ -59,36 +79,27 @@ def debug_references_extraction():
                 # 显示前200字符
                 preview = ref_text[:200].replace('\n', '\\n')
                 print(f"   内容预览: {preview}...")
+        break
     
     # 手动提取参考文献部分（从第15175行开始）
     print(f"\n🎯 手动提取参考文献部分:")
-    lines = text.split('\n')
-    ref_start_line = None
+    title_pos = text.find('## 参考文献')
     
-    for i, line in enumerate(lines):
-        if '## 参考文献' in line:
-            ref_start_line = i
-            print(f"   找到参考文献标题在第 {i+1} 行")
-            break
-    
-    if ref_start_line:
-        # 提取从参考文献开始到文档结尾的内容
-        ref_lines = lines[ref_start_line+1:]  # 跳过标题行
-        
-        # 寻找结束位置
-        end_markers = ['缩略词表', '文献综述', '致谢', 'ACKNOWLEDGMENT', 'APPENDIX', '附录', '作者简介', '个人简历']
-        end_line = len(ref_lines)
+    if title_pos != -1:
+        print(f"   找到参考文献标题在第 {text.count(chr(10), 0, title_pos) + 1} 行")
         
-        for i, line in enumerate(ref_lines):
-            for marker in end_markers:
-                if marker in line:
-                    end_line = i
-                    print(f"   找到结束标记 '{marker}' 在参考文献后第 {i+1} 行")
-                    break
-            if end_line < len(ref_lines):
-                break
+        # 提取从参考文献开始到文档结尾的内容（跳过标题行）
+        body_start = text.find('\n', title_pos)
+        ref_body = text[body_start + 1:] if body_start != -1 else ''
         
-        ref_text = '\n'.join(ref_lines[:end_line])
+        # 寻找结束位置：结束标记所在行之前的内容
+        end_match = END_RE.search(ref_body)
+        if end_match:
+            end_pos = max(ref_body.rfind('\n', 0, end_match.start()), 0)
+            print(f"   找到结束标记 '{end_match.group()}' 在参考文献后第 {ref_body.count(chr(10), 0, end_match.start()) + 1} 行")
+            ref_text = ref_body[:end_pos]
+        else:
+            ref_text = ref_body
         print(f"   手动提取的参考文献长度: {len(ref_text)} 字符")
         
         # 显示前500字符
@@ -99,24 +110,22 @@ def debug_references_extraction():
             # 尝试解析参考文献条目
             print(f"\n📋 解析参考文献条目:")
             
-            # 测试不同的解析模式
-            patterns = [
-                (r'\[(\d+)\]\s*([^\[]+?)(?=\[\d+\]|$)', '[数字]格式'),
-                (r'^\[(\d+)\]\s*([^\n]+)', '行首[数字]格式'),
-                (r'［(\d+)］\s*([^［]+?)(?=［\d+］|$)', '［数字］格式'),
-            ]
-            
-            for pattern, desc in patterns:
-                matches = re.findall(pattern, ref_text, re.MULTILINE | re.DOTALL)
-                print(f"   {desc}: {len(matches)} 条")
-                if matches:
-                    for i, match in enumerate(matches[:3]):  # 显示前3条
-                        if isinstance(match, tuple):
-                            ref_num, ref_content = match
-                            ref_preview = ref_content.strip()[:100]
-                            print(f"     [{ref_num}] {ref_preview}...")
-                    if len(matches) > 3:
-                        print(f"     ... 还有 {len(matches)-3} 条")
+            # 测试不同的解析模式：流式迭代匹配，只保留前3条用于展示
+            for pattern, desc in REF_ENTRY_PATTERNS:
+                match_count = 0
+                preview_matches = []
+                for match in pattern.finditer(ref_text):
+                    match_count += 1
+                    if match_count <= 3:  # 显示前3条
+                        preview_matches.append(match)
+                print(f"   {desc}: {match_count} 条")
+                if match_count:
+                    for match in preview_matches:
+                        ref_num, ref_content = match.groups()
+                        ref_preview = ref_content.strip()[:100]
+                        print(f"     [{ref_num}] {ref_preview}...")
+                    if match_count > 3:
+                        print(f"     ... 还有 {match_count-3} 条")
                     break
 
 if __name__ == '__main__':
@@ -5,6 +5,11 @@
 
 import re
 
+# 合并模式：优先匹配"职称+姓名"，否则回退到导师标签后的整行，一次扫描得到结果
+SUPERVISOR_RE = re.compile(
+    r'Supervisor[：:\s]*(?P<full>(?:Assoc\.\s+)?Prof\.\s+[A-Z]+\s+[A-Z][a-z]+|[^\n]+)'
+)
+
 # 模拟封面文本内容
 cover_text = """
 Candidate：BI Jiazi
@@ -63,3 +68,12 @@ for i, pattern in enumerate(patterns2, 1):
         print(f"   ❌ 无匹配")
     print()
 
+# 合并模式：实际提取时只需一次搜索
+print("测试合并模式:")
+print(f"合并模式: {SUPERVISOR_RE.pattern}")
+match = SUPERVISOR_RE.search(cover_text)
+supervisor = match['full'].strip() if match else None
+if supervisor:
+    print(f"    匹配结果: '{supervisor}'")
+else:
+    print(f"   ❌ 无匹配")
@@ -3,30 +3,52 @@
 """
 import sys
 import os
+import traceback
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+import re
+
 import docx
+from _debug_docx import collect_doc_paths, iter_document_futures, read_paragraph_texts
+
+# 设置 DEBUG_VERBOSE=1 时才输出完整堆栈
+VERBOSE = os.environ.get('DEBUG_VERBOSE') == '1'
+
+# 目录条目特征（包含后记的识别），合并为一个正则，一次匹配完成判断
+TOC_ENTRY_RE = re.compile('|'.join([
+    r'第[一二三四五六七八九十\d]+章.+\d+$',  # 第X章...页码
+    r'\d+\.?\d*\s+.+\d+$',  # 1.1 标题...页码
+    r'摘\s*要.+[IVX\d]+$',  # 摘要...页码
+    r'Abstract.+[IVX\d]+$',  # Abstract...页码
+    r'参\s*考\s*文\s*献.+\d+$',  # 参考文献...页码
+    r'个人简历.+\d+$',  # 个人简历...页码
+    r'后\s*记.+\d+$',  # 后记...页码 - 专门添加
+    r'结\s*束\s*语.+\d+$',  # 结束语...页码
+    r'.+\s+\d+$',  # 标题 页码（最宽泛的匹配）
+]))
+
+DEFAULT_DOC_PATH = r"c:\MyProjects\thesis_Inno_Eval\data\input\1_马克思主义哲学86406_010101_81890101_LW.docx"
 
-def debug_toc_boundary():
+def debug_toc_boundary(doc_path=DEFAULT_DOC_PATH, doc=None):
     """调试目录边界问题"""
-    doc_path = r"c:\MyProjects\thesis_Inno_Eval\data\input\1_马克思主义哲学86406_010101_81890101_LW.docx"
-    
     print("🔍 调试马克思主义哲学论文目录边界")
     print("="*80)
     
     try:
-        doc = docx.Document(doc_path)
+        if doc is None:
+            doc = docx.Document(doc_path)
+        # 段落文本只读取一次，直接走XPath，不为每段创建 Paragraph 包装对象
+        paragraphs = read_paragraph_texts(doc)
         
         print("📄 检查第25-35行内容 (查找后记):")
         print("-" * 60)
         
-        for i in range(24, 35):  # 第25-35行
-            if i < len(doc.paragraphs):
-                text = doc.paragraphs[i].text.strip()
-                if text:
-                    print(f"第{i+1:3d}行: {text}")
-                    if "后" in text and "记" in text:
-                        print(f"     ▶ 发现后记相关内容!")
+        for i, text in enumerate(paragraphs[24:35], start=24):  # 第25-35行
+            text = text.strip()
+            if text:
+                print(f"第{i+1:3d}行: {text}")
+                if "后" in text and "记" in text:
+                    print(f"     ▶ 发现后记相关内容!")
         
         # 直接应用目录提取逻辑
         print(f"\n🔧 应用目录提取逻辑:")
@@ -36,8 +58,8 @@ def debug_toc_boundary():
         toc_start = -1
         toc_end = -1
         
-        for i, paragraph in enumerate(doc.paragraphs):
-            line = paragraph.text.strip()
+        for i, text in enumerate(paragraphs):
+            line = text.strip()
             
             # 查找目录开始
             if toc_start == -1 and "目  录" in line:
@@ -75,54 +97,46 @@ def debug_toc_boundary():
         
         if toc_start != -1:
             if toc_end == -1:
-                toc_end = min(toc_start + 50, len(doc.paragraphs))
+                toc_end = min(toc_start + 50, len(paragraphs))
                 print(f" 未找到明确结束，设置为: 第{toc_end}行")
             
             print(f"\n📋 目录内容 (第{toc_start+1}行到第{toc_end}行):")
             print("-" * 80)
             
-            for i in range(toc_start, toc_end):
-                if i < len(doc.paragraphs):
-                    text = doc.paragraphs[i].text.strip()
-                    if text:
-                        is_toc = is_toc_entry_debug(text)
-                        marker = "" if is_toc else "❌"
-                        print(f"第{i+1:3d}行: {marker} {text}")
-                        if "后" in text and "记" in text:
-                            print(f"     ▶ 后记相关条目!")
+            for i, text in enumerate(paragraphs[toc_start:toc_end], start=toc_start):
+                text = text.strip()
+                if text:
+                    is_toc = is_toc_entry_debug(text)
+                    marker = "" if is_toc else "❌"
+                    print(f"第{i+1:3d}行: {marker} {text}")
+                    if "后" in text and "记" in text:
+                        print(f"     ▶ 后记相关条目!")
         
     except Exception as e:
-        print(f"❌ 调试失败: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ 调试失败: {type(e).__name__}: {e}")
+        if VERBOSE:
+            print(traceback.format_exc())
 
 def is_toc_entry_debug(line: str) -> bool:
     """调试版本的目录条目判断"""
-    if not line.strip():
-        return False
-    
     line = line.strip()
-    
-    import re
-    # 目录条目特征 - 包含后记的识别
-    toc_patterns = [
-        r'^第[一二三四五六七八九十\d]+章.+\d+$',  # 第X章...页码
-        r'^\d+\.?\d*\s+.+\d+$',  # 1.1 标题...页码
-        r'^摘\s*要.+[IVX\d]+$',  # 摘要...页码
-        r'^Abstract.+[IVX\d]+$',  # Abstract...页码
-        r'^参\s*考\s*文\s*献.+\d+$',  # 参考文献...页码
-        r'^个人简历.+\d+$',  # 个人简历...页码
-        r'^后\s*记.+\d+$',  # 后记...页码 - 专门添加
-        r'^结\s*束\s*语.+\d+$',  # 结束语...页码
-        r'^.+\s+\d+$',  # 标题 页码（最宽泛的匹配）
-    ]
-    
-    for pattern in toc_patterns:
-        if re.match(pattern, line):
-            return True
-    
-    return False
+    if not line:
+        return False
+    return TOC_ENTRY_RE.match(line) is not None
 
 if __name__ == "__main__":
-    debug_toc_boundary()
-
+    if len(sys.argv) > 1:
+        doc_paths = collect_doc_paths(sys.argv[1:])
+        if not doc_paths:
+            print(f"❌ 未找到docx文档: {' '.join(sys.argv[1:])}")
+            sys.exit(1)
+        # 批量调试：后台预先打开后续文档，逐个输出调试信息；单个文档打不开不影响其余文档
+        for doc_path, future in iter_document_futures(doc_paths):
+            try:
+                doc = future.result()
+            except Exception as e:
+                print(f"❌ 打开文档失败: {doc_path} - {type(e).__name__}: {e}")
+                continue
+            debug_toc_boundary(doc_path, doc)
+    else:
+        debug_toc_boundary()
@@ -6,11 +6,78 @@
 
 import sys
 import os
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import accumulate
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import docx
 from src.thesis_inno_eval.ai_toc_extractor import AITocExtractor
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# 标准目录模式：六种目录行合并为一个正则，每行只做一次匹配
+#   第X章 标题 页码 / 1. 1.1 1.1.1 标题 页码 / ABSTRACT 标题 页码 / 特殊章节
+TOC_LINE_RE = re.compile(
+    r'^(?:(?P<chapter>第[一二三四五六七八九十\d]+章)'
+    r'|(?P<number>\d+\.(?:\d+(?:\.\d+)?)?)'
+    r'|(?P<upper>[A-Z]+))\s*(?P<title>.+?)(?:\s+(?P<page>\d+))?$'
+    r'|^(?P<special>摘\s*要|目\s*录|参考文献|致\s*谢|攻读|附\s*录)\s*(?P<rest>.*)(?:\s+(?P<special_page>\d+))?$',
+    re.IGNORECASE
+)
+
+# 手动搜索的特定目录项：(必含字面量, 模式)，先用字面量筛出候选行再跑正则
+TARGET_PATTERNS = [(anchor, re.compile(p, re.IGNORECASE)) for anchor, p in (
+    ('第一章', r'第一章.*绪论'),
+    ('1.1', r'1\.1.*选题背景'),
+    ('参考文献', r'参考文献'),
+    ('攻读', r'攻读.*硕士.*学位.*期间.*成果'),
+    ('致', r'致.*谢'),
+)]
+TARGET_ANCHORS = tuple(anchor for anchor, _ in TARGET_PATTERNS)
+
+# 目录特殊章节关键词
+TOC_KEYWORDS = ('摘要', '参考文献', '致谢', '攻读', '附录')
+
+# 行尾页码
+PAGE_RE = re.compile(r'\d+$')
+
+
+def _build_automaton(words):
+    """将字面量构建为 Aho-Corasick 自动机；pyahocorasick 不可用时返回 None"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+TOC_KEYWORD_AUTOMATON = _build_automaton(TOC_KEYWORDS)
+TARGET_ANCHOR_AUTOMATON = _build_automaton(TARGET_ANCHORS)
+# 无 pyahocorasick 时的回退：字面量合并为一个交替式
+TOC_KEYWORD_RE = re.compile('|'.join(map(re.escape, TOC_KEYWORDS)))
+TARGET_ANCHOR_RE = re.compile('|'.join(map(re.escape, TARGET_ANCHORS)))
+
+
+def find_literal_lines(content, line_starts, automaton, fallback_re):
+    """单次扫描全文，返回 {行下标: 该行命中的字面量集合}"""
+    hits = defaultdict(set)
+    if automaton is not None:
+        for end, word in automaton.iter(content):
+            hits[bisect_right(line_starts, end) - 1].add(word)
+    else:
+        for match in fallback_re.finditer(content):
+            hits[bisect_right(line_starts, match.start()) - 1].add(match.group())
+    return hits
+
 def debug_toc_content():
     """调试目录内容提取"""
     print("🔍 调试目录内容提取")
@@ -21,9 +88,8 @@ def debug_toc_content():
     try:
         # 读取文档内容
         doc = docx.Document(doc_path)
-        content = ""
-        for paragraph in doc.paragraphs:
-            content += paragraph.text + "\n"
+        # 一次性拼接，避免逐段 += 造成的反复复制
+        content = "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
         
         # 创建提取器实例
         extractor = AITocExtractor()
@@ -34,30 +100,21 @@ def debug_toc_content():
         lines = content.split('\n')
         extracted_lines = []
         
-        # 标准目录模式
-        chapter_patterns = [
-            r'^(第[一二三四五六七八九十\d]+章)\s*(.+?)(?:\s+(\d+))?$',  # 第X章 标题 页码
-            r'^(\d+\.)\s*(.+?)(?:\s+(\d+))?$',                           # 1. 标题 页码
-            r'^(\d+\.\d+)\s*(.+?)(?:\s+(\d+))?$',                       # 1.1 标题 页码
-            r'^(\d+\.\d+\.\d+)\s*(.+?)(?:\s+(\d+))?$',                  # 1.1.1 标题 页码
-            r'^([A-Z]+)\s*(.+?)(?:\s+(\d+))?$',                         # ABSTRACT 标题 页码
-            r'^(摘\s*要|目\s*录|参考文献|致\s*谢|攻读|附\s*录)\s*(.*)(?:\s+(\d+))?$'  # 特殊章节
-        ]
+        # 关键词与目标项的必含字面量各只扫描一次全文，按行分桶
+        line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+        keyword_lines = find_literal_lines(content, line_starts, TOC_KEYWORD_AUTOMATON, TOC_KEYWORD_RE)
+        target_hits = find_literal_lines(content, line_starts, TARGET_ANCHOR_AUTOMATON, TARGET_ANCHOR_RE)
         
-        import re
-        for line in lines:
+        for i, line in enumerate(lines):
             line = line.strip()
             if not line or len(line) < 2:
                 continue
                 
             # 检查是否匹配目录模式
-            for pattern in chapter_patterns:
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    # 简单的目录行判断 - 检查是否包含页码或章节标识
-                    if ('第' in line and '章' in line) or re.search(r'\d+$', line) or any(keyword in line for keyword in ['摘要', '参考文献', '致谢', '攻读', '附录']):
-                        extracted_lines.append(line)
-                        break
+            if TOC_LINE_RE.match(line):
+                # 简单的目录行判断 - 检查是否包含页码或章节标识
+                if ('第' in line and '章' in line) or PAGE_RE.search(line) or i in keyword_lines:
+                    extracted_lines.append(line)
         
         if extracted_lines:
             print(f" 找到 {len(extracted_lines)} 行可能的目录内容:")
@@ -71,27 +128,15 @@ def debug_toc_content():
         print(f"\n🔍 手动搜索特定目录项:")
         print("-" * 60)
         
-        target_patterns = [
-            r'第一章.*绪论',
-            r'1\.1.*选题背景',
-            r'参考文献',
-            r'攻读.*硕士.*学位.*期间.*成果',
-            r'致.*谢'
-        ]
-        
-        lines = content.split('\n')
         found_items = []
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-                
-            for j, pattern in enumerate(target_patterns):
-                import re
-                if re.search(pattern, line, re.IGNORECASE):
-                    found_items.append((i+1, line, pattern))
-                    print(f"第{i+1:3d}行: {line} [匹配: {pattern}]")
+        for i in sorted(target_hits):
+            line = lines[i].strip()
+            anchors = target_hits[i]
+            for anchor, pattern in TARGET_PATTERNS:
+                if anchor in anchors and pattern.search(line):
+                    found_items.append((i+1, line, pattern.pattern))
+                    print(f"第{i+1:3d}行: {line} [匹配: {pattern.pattern}]")
         
         if found_items:
             print(f"\n 找到 {len(found_items)} 个目标目录项")
@@ -101,16 +146,17 @@ def debug_toc_content():
         # 显示包含"第一章"的所有行
         print(f"\n🔍 搜索包含'第一章'的所有行:")
         print("-" * 60)
-        for i, line in enumerate(lines):
-            if '第一章' in line:
-                print(f"第{i+1:3d}行: {line.strip()}")
+        # 直接复用前面字面量扫描的分桶结果，不再逐行做子串查找
+        for i in sorted(target_hits):
+            if '第一章' in target_hits[i]:
+                print(f"第{i+1:3d}行: {lines[i].strip()}")
         
         # 显示包含"1.1"的所有行
         print(f"\n🔍 搜索包含'1.1'的所有行:")
         print("-" * 60)
-        for i, line in enumerate(lines):
-            if '1.1' in line and len(line.strip()) < 100:  # 避免正文内容
-                print(f"第{i+1:3d}行: {line.strip()}")
+        for i in sorted(target_hits):
+            if '1.1' in target_hits[i] and len(lines[i].strip()) < 100:  # 避免正文内容
+                print(f"第{i+1:3d}行: {lines[i].strip()}")
                 
     except Exception as e:
         print(f"❌ 调试失败: {str(e)}")
@@ -3,8 +3,83 @@
 调试Word文档内容和TOC字段
 """
 
-import docx
+import contextlib
+import io
 import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+from _debug_docx import paragraph_text
+
+# WordprocessingML 命名空间与常用标签
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W = '{%s}' % W_NS
+BODY, P, TBL, SECT_PR = W + 'body', W + 'p', W + 'tbl', W + 'sectPr'
+# 域代码：复杂域的指令在 w:instrText 中，简单域的指令在 w:fldSimple 的 w:instr 属性中
+INSTR_TEXT, FLD_SIMPLE = W + 'instrText', W + 'fldSimple'
+
+# 内置样式在 styles.xml 中是小写名，显示时换成界面名称（与 python-docx 一致）
+STYLE_UI_NAMES = {
+    'caption': 'Caption', 'footer': 'Footer', 'header': 'Header',
+    **{f'heading {level}': f'Heading {level}' for level in range(1, 10)},
+}
+
+# 文档属性（docProps/core.xml）
+CORE_NS = {
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+}
+CORE_FIELDS = (
+    ('标题', 'dc:title'),
+    ('作者', 'dc:creator'),
+    ('主题', 'dc:subject'),
+    ('创建时间', 'dcterms:created'),
+    ('修改时间', 'dcterms:modified'),
+)
+
+
+def has_toc_field(p, style_id):
+    """段落是否属于目录：目录样式（TOC1、TOC 2…）或含 TOC 域指令。
+    只在域指令元素上取值，不再把整个段落序列化成XML字符串再查找"""
+    if style_id and 'TOC' in style_id:
+        return True
+    for field in p.iter(INSTR_TEXT, FLD_SIMPLE):
+        instr = field.text if field.tag == INSTR_TEXT else field.get(W + 'instr')
+        if instr and 'TOC' in instr:
+            return True
+    return False
+
+
+def read_paragraph_styles(docx_zip):
+    """读取段落样式表，返回 ({样式ID: 样式名}, 默认段落样式名)"""
+    try:
+        styles_root = etree.fromstring(docx_zip.read('word/styles.xml'))
+    except KeyError:
+        return {}, None
+    names = {}
+    default_name = None
+    for style in styles_root.iterchildren(W + 'style'):
+        if style.get(W + 'type') != 'paragraph':
+            continue
+        name_el = style.find(W + 'name')
+        name = name_el.get(W + 'val') if name_el is not None else style.get(W + 'styleId')
+        name = STYLE_UI_NAMES.get(name, name)
+        names[style.get(W + 'styleId')] = name
+        if style.get(W + 'default') == '1':
+            default_name = name
+    return names, default_name
+
+
+def read_core_properties(docx_zip):
+    """读取文档属性；缺少 core.xml 时返回空字典"""
+    try:
+        core_root = etree.fromstring(docx_zip.read('docProps/core.xml'))
+    except KeyError:
+        return {}
+    return {label: core_root.findtext(path, namespaces=CORE_NS) for label, path in CORE_FIELDS}
+
 
 def debug_word_document(file_path):
     """调试Word文档的详细内容"""
@@ -16,56 +91,86 @@ def debug_word_document(file_path):
         return
     
     try:
-        doc = docx.Document(file_path)
-        
-        print(f"📊 文档统计:")
-        print(f"  段落数量: {len(doc.paragraphs)}")
-        print(f"  表格数量: {len(doc.tables)}")
-        print(f"  节数量: {len(doc.sections)}")
-        
-        print(f"\n📝 段落内容分析:")
-        total_chars = 0
-        non_empty_paragraphs = 0
-        
-        for i, paragraph in enumerate(doc.paragraphs):
-            text = paragraph.text
-            total_chars += len(text)
+        with zipfile.ZipFile(file_path) as docx_zip:
+            style_names, default_style = read_paragraph_styles(docx_zip)
+            core_properties = read_core_properties(docx_zip)
             
-            if text.strip():
-                non_empty_paragraphs += 1
-                print(f"  段落 {i+1}: {repr(text[:100])} {'...' if len(text) > 100 else ''}")
-                
-                # 检查段落的样式信息
-                if paragraph.style:
-                    print(f"    样式: {paragraph.style.name}")
-                
-                # 检查段落的XML
-                if hasattr(paragraph, '_element'):
-                    xml_text = paragraph._element.xml
-                    if 'TOC' in xml_text or 'fldChar' in xml_text:
-                        print(f"    🔍 包含TOC字段信息")
-                        print(f"    XML片段: {xml_text[:200]}...")
+            print(f"\n📝 段落内容分析:")
+            paragraph_count = 0
+            table_count = 0
+            section_count = 0
+            total_chars = 0
+            non_empty_paragraphs = 0
+            
+            # 流式解析 document.xml：只处理正文一级的段落/表格，处理完即释放子树，
+            # 不为每个段落创建 python-docx 包装对象
+            with docx_zip.open('word/document.xml') as document_xml:
+                for _, element in etree.iterparse(document_xml, events=('end',), tag=(P, TBL, SECT_PR)):
+                    parent = element.getparent()
+                    if parent is None or parent.tag != BODY:
+                        continue
+                    
+                    if element.tag == TBL:
+                        table_count += 1
+                    elif element.tag == SECT_PR:
+                        section_count += 1
+                    else:
+                        paragraph_count += 1
+                        if element.find(f'{W}pPr/{W}sectPr') is not None:
+                            section_count += 1
+                        
+                        text = paragraph_text(element)
+                        total_chars += len(text)
+                        
+                        if text.strip():
+                            non_empty_paragraphs += 1
+                            print(f"  段落 {paragraph_count}: {repr(text[:100])} {'...' if len(text) > 100 else ''}")
+                            
+                            # 检查段落的样式信息
+                            style_el = element.find(f'{W}pPr/{W}pStyle')
+                            style_id = style_el.get(W + 'val') if style_el is not None else None
+                            style_name = style_names.get(style_id) or default_style
+                            if style_name:
+                                print(f"    样式: {style_name}")
+                            
+                            # 检查段落是否含TOC域
+                            if has_toc_field(element, style_id):
+                                print(f"    🔍 包含TOC字段信息")
+                                print(f"    XML片段: {etree.tostring(element, encoding='unicode')[:200]}...")
+                    
+                    # 释放已处理的子树及之前的兄弟节点，内存占用不随段落数增长
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del parent[0]
+        
+        print(f"\n📊 文档统计:")
+        print(f"  段落数量: {paragraph_count}")
+        print(f"  表格数量: {table_count}")
+        print(f"  节数量: {section_count}")
         
         print(f"\n📊 内容统计:")
         print(f"  总字符数: {total_chars}")
         print(f"  非空段落数: {non_empty_paragraphs}")
-        print(f"  平均段落长度: {total_chars/len(doc.paragraphs) if doc.paragraphs else 0:.1f}")
+        print(f"  平均段落长度: {total_chars/paragraph_count if paragraph_count else 0:.1f}")
         
         # 检查文档属性
-        if hasattr(doc, 'core_properties'):
-            props = doc.core_properties
+        if core_properties:
             print(f"\n📋 文档属性:")
-            print(f"  标题: {props.title}")
-            print(f"  作者: {props.author}")
-            print(f"  主题: {props.subject}")
-            print(f"  创建时间: {props.created}")
-            print(f"  修改时间: {props.modified}")
+            for label, value in core_properties.items():
+                print(f"  {label}: {value}")
         
     except Exception as e:
         print(f"❌ 分析失败: {e}")
         import traceback
         traceback.print_exc()
 
+def debug_word_document_report(file_path):
+    """在子进程中分析单个文件，返回完整输出文本，避免多进程打印交错"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        debug_word_document(file_path)
+    return buffer.getvalue()
+
 def test_multiple_files():
     """测试多个文件"""
     test_files = [
@@ -74,9 +179,12 @@ def test_multiple_files():
         "data/input/1_计算机应用技术_17211204005-苏慧婧-基于MLP和SepCNN模型的藏文文本分类研究与实现-计算机应用技术-群诺.docx"
     ]
     
-    for file_path in test_files:
-        debug_word_document(file_path)
-        print("\n" + "="*80 + "\n")
+    # 各文件的解析互不依赖且是CPU密集型，用多进程绕开GIL；按提交顺序输出
+    max_workers = min(len(test_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for report in executor.map(debug_word_document_report, test_files):
+            print(report, end='')
+            print("\n" + "="*80 + "\n")
 
 if __name__ == "__main__":
     test_multiple_files()
@@ -7,19 +7,172 @@ import os
 import sys
 import json
 import re
+import contextlib
+import io
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
 # 添加项目路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-def extract_missing_fields():
+DEFAULT_MD_FILE = project_root / "data" / "output" / "Bi-Sb-Se基材料的制备及热电性能研究.md"
+
+# 参考文献条目行：去掉行首空白后以 "[" 或 "数字." 开头，整段文本一次扫描取出
+REF_LINE_RE = re.compile(r'^[^\S\n]*(?:\[|\d+\.).*', re.MULTILINE)
+# 创新点分条行：以 ( （ "数字." "数字、" 或 ①-⑩ 开头，同样整段一次扫描
+INNOVATION_POINT_RE = re.compile(r'^[^\S\n]*(?:[(（]|[0-9]+[\.、]|[①-⑩]).*', re.MULTILINE)
+
+
+def load_json(path):
+    """读取JSON文件；有 orjson 时直接解析字节"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json_bytes(data):
+    """序列化为缩进2格、不转义中文的UTF-8字节，与 json.dump(ensure_ascii=False, indent=2) 输出一致"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+@lru_cache(maxsize=4096)
+def _rc(pattern, flags=0):
+    """编译并缓存正则；re 模块内部缓存容量有限，批量处理多篇论文时会被冲掉"""
+    return re.compile(pattern, flags)
+
+# 封面字段：(锚点字面量, 取值正则)；正则只在锚点出现处做锚定匹配
+AUTHOR_FIELDS = tuple((anchor, re.compile(pattern)) for anchor, pattern in (
+    ('作者', r'作者[：:]\s*([^\n\r]{2,20})'),
+    ('申请人', r'申请人[：:]\s*([^\n\r]{2,20})'),
+    ('研究生', r'研究生[：:]\s*([^\n\r]{2,20})'),
+    ('学生姓名', r'学生姓名[：:]\s*([^\n\r]{2,20})'),
+    ('姓', r'姓\s*名[：:]\s*([^\n\r]{2,20})'),
+))
+
+# 学校字段：第三项为 True 时匹配从锚点所在分句（以，。换行分隔）的开头开始
+UNIVERSITY_FIELDS = tuple((anchor, re.compile(pattern), from_clause) for anchor, pattern, from_clause in (
+    ('大学', r'([^，。\n\r]*大学[^，。\n\r]{0,10})', True),
+    ('学院', r'([^，。\n\r]*学院[^，。\n\r]{0,10})', True),
+    ('培养单位', r'培养单位[：:]\s*([^\n\r]{5,50})', False),
+    ('学校', r'学校[：:]\s*([^\n\r]{5,50})', False),
+    ('院校', r'院校[：:]\s*([^\n\r]{5,50})', False),
+))
+
+FIELD_ANCHORS = tuple(dict.fromkeys(
+    [anchor for anchor, _ in AUTHOR_FIELDS] + [anchor for anchor, _, _ in UNIVERSITY_FIELDS]
+))
+CLAUSE_DELIMITERS = '，。\n\r'
+
+
+def _build_anchor_automaton(anchors):
+    """将锚点字面量构建为 Aho-Corasick 自动机；pyahocorasick 不可用时返回 None"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for anchor in anchors:
+        automaton.add_word(anchor, anchor)
+    automaton.make_automaton()
+    return automaton
+
+
+FIELD_ANCHOR_AUTOMATON = _build_anchor_automaton(FIELD_ANCHORS)
+# 无 pyahocorasick 时的回退：所有标签合并为一个零宽前瞻交替式，一次扫描即可得到
+# 全部（含重叠的）命中；各标签互不为前缀，同一位置至多命中一个标签
+FIELD_ANCHOR_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, FIELD_ANCHORS)))
+
+
+def find_anchor_hits(text):
+    """单次扫描文本，返回 {锚点: 升序起始位置列表}（允许重叠，如"大学院"）"""
+    hits = {anchor: [] for anchor in FIELD_ANCHORS}
+    if FIELD_ANCHOR_AUTOMATON is not None:
+        for end, anchor in FIELD_ANCHOR_AUTOMATON.iter(text):
+            hits[anchor].append(end - len(anchor) + 1)
+    else:
+        for match in FIELD_ANCHOR_RE.finditer(text):
+            hits[match.group(1)].append(match.start())
+    return hits
+
+
+def _clause_start(text, pos):
+    """pos 所在分句的起始位置"""
+    return max(text.rfind(delimiter, 0, pos) for delimiter in CLAUSE_DELIMITERS) + 1
+
+
+def iter_field_matches(text, pattern, starts):
+    """只在候选起点做锚定匹配，结果与 pattern.finditer(text) 一致"""
+    last_end = 0
+    for start in starts:
+        if start < last_end:
+            continue
+        match = pattern.match(text, start)
+        if match:
+            last_end = match.end()
+            yield match
+
+# 全文模式族：(组名, 起始字面量, 完整模式)。同族的起始字面量合并为一个零宽前瞻
+# 交替式，全文只扫描一次即可定位各模式的候选起点，再逐点做锚定匹配；
+# 同族内各起始字面量不会在同一位置同时命中
+CONCLUSION_PATTERNS = (
+    ('h1_conclusion', r'# 结论', r'# 结论[\s\S]*?(?=# [^结]|$)'),
+    ('h1_summary', r'# 总结', r'# 总结[\s\S]*?(?=# [^总]|$)'),
+    ('h2_conclusion', r'## 结论', r'## 结论[\s\S]*?(?=## [^结]|$)'),
+    ('conclusion_label', r'结论[：:]', r'结论[：:][\s\S]*?(?=\n#|\n[0-9]+\.|\n[一二三四五六七八九十]|$)'),
+    ('h2_brief', r'## 小结', r'## 小结[\s\S]*?(?=## [^小]|$)'),
+)
+
+INNOVATION_PATTERNS = (
+    ('innovation_point', r'创新', r'创新.*?点[：:][\s\S]*?(?=\n#|\n[0-9]+\.)'),
+    ('main_contribution', r'主要', r'主要.*?贡献[：:][\s\S]*?(?=\n#|\n[0-9]+\.)'),
+    ('tech_innovation', r'技术', r'技术.*?创新[：:][\s\S]*?(?=\n#|\n[0-9]+\.)'),
+)
+
+
+def _compile_pattern_family(patterns):
+    """返回 (起点扫描正则, ((组名, 编译后的完整模式), ...))"""
+    scanner = re.compile('(?=%s)' % '|'.join(f'(?P<{name}>{anchor})' for name, anchor, _ in patterns))
+    compiled = tuple((name, re.compile(pattern, re.MULTILINE | re.DOTALL)) for name, _, pattern in patterns)
+    return scanner, compiled
+
+
+CONCLUSION_SCANNER, CONCLUSION_REGEXES = _compile_pattern_family(CONCLUSION_PATTERNS)
+INNOVATION_SCANNER, INNOVATION_REGEXES = _compile_pattern_family(INNOVATION_PATTERNS)
+
+
+def iter_family_matches(text, scanner, patterns):
+    """一次扫描后按模式顺序产出 (组名, 匹配迭代器)，每个迭代器与该模式的 finditer 结果一致"""
+    starts = {name: [] for name, _ in patterns}
+    for match in scanner.finditer(text):
+        starts[match.lastgroup].append(match.start())
+    for name, pattern in patterns:
+        yield name, iter_field_matches(text, pattern, starts[name])
+
+def extract_missing_fields(md_file=DEFAULT_MD_FILE):
     """补充缺失的重要字段"""
     
     print("🎯 增强Bi-Sb-Se论文信息抽取 - 补充缺失字段")
     
     # 读取原始Markdown文件
-    md_file = project_root / "data" / "output" / "Bi-Sb-Se基材料的制备及热电性能研究.md"
+    md_file = Path(md_file)
     
     if not md_file.exists():
         print(f"❌ Markdown文件不存在: {md_file}")
@@ -37,32 +190,30 @@ def extract_missing_fields():
     print(f"📊 文档长度: {len(text_content):,} 字符")
     
     # 读取现有的抽取结果
-    existing_file = project_root / "data" / "output" / "Bi-Sb-Se基材料的制备及热电性能研究_extracted_info.json"
+    existing_file = md_file.with_name(f"{md_file.stem}_extracted_info.json")
     
     if existing_file.exists():
-        with open(existing_file, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
+        existing_data = load_json(existing_file)
         print(f"📋 读取现有数据: {len(existing_data)} 个字段")
     else:
         existing_data = {}
         print("📋 未找到现有数据，从零开始")
     
     # 增强字段提取
-    enhanced_data = existing_data.copy()
+    # 新字段写入 new_fields，读取时回落到现有数据，不复制 existing_data
+    new_fields = {}
+    enhanced_data = ChainMap(new_fields, existing_data)
     
     print("\n🔍 开始补充缺失字段...")
     
-    # 1. 提取作者信息
-    author_patterns = [
-        r'作者[：:]\s*([^\n\r]{2,20})',
-        r'申请人[：:]\s*([^\n\r]{2,20})',
-        r'研究生[：:]\s*([^\n\r]{2,20})',
-        r'学生姓名[：:]\s*([^\n\r]{2,20})',
-        r'姓\s*名[：:]\s*([^\n\r]{2,20})',
-    ]
+    # 封面区域只切片一次；封面字段的锚点字面量只扫描一次前8000字符
+    cover_text = text_content[:8000]
+    anchor_hits = find_anchor_hits(cover_text)
     
-    for pattern in author_patterns:
-        match = re.search(pattern, text_content[:5000], re.MULTILINE)
+    # 1. 提取作者信息
+    author_text = cover_text[:5000]
+    for anchor, pattern in AUTHOR_FIELDS:
+        match = next(iter_field_matches(author_text, pattern, anchor_hits[anchor]), None)
         if match:
             author = match.group(1).strip()
             if author and len(author) < 20 and not any(char in author for char in ['：', ':', '，', '。']):
@@ -71,18 +222,13 @@ def extract_missing_fields():
                 break
     
     # 2. 提取学校信息
-    university_patterns = [
-        r'([^，。\n\r]*大学[^，。\n\r]{0,10})',
-        r'([^，。\n\r]*学院[^，。\n\r]{0,10})',
-        r'培养单位[：:]\s*([^\n\r]{5,50})',
-        r'学校[：:]\s*([^\n\r]{5,50})',
-        r'院校[：:]\s*([^\n\r]{5,50})',
-    ]
-    
-    for pattern in university_patterns:
-        matches = re.findall(pattern, text_content[:8000])
-        for match in matches:
-            university = match.strip()
+    university_text = cover_text
+    for anchor, pattern, from_clause in UNIVERSITY_FIELDS:
+        starts = anchor_hits[anchor]
+        if from_clause:
+            starts = (_clause_start(university_text, pos) for pos in starts)
+        for match in iter_field_matches(university_text, pattern, starts):
+            university = match.group(1).strip()
             if university and len(university) > 4 and len(university) < 50:
                 if '大学' in university or '学院' in university:
                     enhanced_data['ChineseUniversity'] = university
@@ -101,27 +247,19 @@ def extract_missing_fields():
     ]
     
     for pattern in degree_patterns:
-        match = re.search(pattern, text_content[:5000])
+        # endpos 限定搜索范围，效果等同于在前5000字符的切片上搜索，但不复制字符串
+        match = _rc(pattern).search(text_content, 0, 5000)
         if match:
             degree = match.group(1)
             enhanced_data['DegreeLevel'] = degree
             print(f" 找到学位级别: {degree}")
             break
     
-    # 4. 提取结论部分
-    conclusion_patterns = [
-        r'# 结论[\s\S]*?(?=# [^结]|$)',
-        r'# 总结[\s\S]*?(?=# [^总]|$)',
-        r'## 结论[\s\S]*?(?=## [^结]|$)',
-        r'结论[：:][\s\S]*?(?=\n#|\n[0-9]+\.|\n[一二三四五六七八九十]|$)',
-        r'## 小结[\s\S]*?(?=## [^小]|$)',
-    ]
-    
+    # 4. 提取结论部分（五个模式共用一次全文扫描）
     conclusions = []
-    for pattern in conclusion_patterns:
-        matches = re.findall(pattern, text_content, re.MULTILINE | re.DOTALL)
+    for _, matches in iter_family_matches(text_content, CONCLUSION_SCANNER, CONCLUSION_REGEXES):
         for match in matches:
-            conclusion = match.strip()
+            conclusion = match.group().strip()
             if len(conclusion) > 100:  # 结论应该有一定长度
                 conclusions.append(conclusion)
     
@@ -139,19 +277,10 @@ def extract_missing_fields():
     ]
     
     for pattern in ref_patterns:
-        match = re.search(pattern, text_content, re.MULTILINE | re.DOTALL)
+        match = _rc(pattern, re.MULTILINE | re.DOTALL).search(text_content)
         if match:
             ref_section = match.group(1).strip()
-            ref_lines = []
-            
-            for line in ref_section.split('\n'):
-                line = line.strip()
-                if line:
-                    # 检查是否是参考文献条目
-                    if (line.startswith('[') or 
-                        re.match(r'^\d+\.', line) or
-                        re.match(r'^\[\d+\]', line)):
-                        ref_lines.append(line)
+            ref_lines = [match.group().strip() for match in REF_LINE_RE.finditer(ref_section)]
             
             if len(ref_lines) > 10:  # 至少10条参考文献才认为有效
                 enhanced_data['ReferenceList'] = ref_lines
@@ -166,7 +295,7 @@ def extract_missing_fields():
     ]
     
     for pattern in research_problem_patterns:
-        match = re.search(pattern, text_content, re.MULTILINE | re.DOTALL)
+        match = _rc(pattern, re.MULTILINE | re.DOTALL).search(text_content)
         if match:
             problem = match.group(0).strip()
             if len(problem) > 50:
@@ -176,24 +305,13 @@ def extract_missing_fields():
     
     # 7. 提取创新点（如果现有不够详细）
     if 'MainInnovations' not in enhanced_data or len(enhanced_data.get('MainInnovations', [])) < 3:
-        innovation_patterns = [
-            r'创新.*?点[：:][\s\S]*?(?=\n#|\n[0-9]+\.)',
-            r'主要.*?贡献[：:][\s\S]*?(?=\n#|\n[0-9]+\.)',
-            r'技术.*?创新[：:][\s\S]*?(?=\n#|\n[0-9]+\.)',
-        ]
-        
-        for pattern in innovation_patterns:
-            match = re.search(pattern, text_content, re.MULTILINE | re.DOTALL)
+        # 三个模式共用一次全文扫描；每个模式取第一个匹配，等同于 search
+        for _, matches in iter_family_matches(text_content, INNOVATION_SCANNER, INNOVATION_REGEXES):
+            match = next(matches, None)
             if match:
                 innovation_text = match.group(0).strip()
                 # 尝试分点提取
-                innovation_points = []
-                for line in innovation_text.split('\n'):
-                    line = line.strip()
-                    if (line.startswith('(') or line.startswith('（') or 
-                        re.match(r'^[0-9]+[\.、]', line) or
-                        re.match(r'^[①②③④⑤⑥⑦⑧⑨⑩]', line)):
-                        innovation_points.append(line)
+                innovation_points = [match.group().strip() for match in INNOVATION_POINT_RE.finditer(innovation_text)]
                 
                 if len(innovation_points) >= 2:
                     enhanced_data['MainInnovations'] = innovation_points
@@ -232,17 +350,17 @@ def extract_missing_fields():
             print(f"   ❌ {field}: [仍为空]")
     
     # 保存增强后的结果
-    output_file = project_root / "data" / "output" / "Bi-Sb-Se基材料的制备及热电性能研究_extracted_info_enhanced.json"
+    output_file = md_file.with_name(f"{md_file.stem}_extracted_info_enhanced.json")
     
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_data, f, ensure_ascii=False, indent=2)
+        # 只序列化一次，两个文件写入同一份字节
+        payload = dump_json_bytes(dict(enhanced_data))
+        output_file.write_bytes(payload)
         
         print(f"\n💾 增强结果已保存到: {output_file.name}")
         
         # 也更新原文件
-        with open(existing_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_data, f, ensure_ascii=False, indent=2)
+        existing_file.write_bytes(payload)
         
         print(f"💾 原文件已更新: {existing_file.name}")
         print(" 字段补充完成！")
@@ -250,6 +368,26 @@ def extract_missing_fields():
     except Exception as e:
         print(f"❌ 保存失败: {e}")
 
+def extract_missing_fields_report(md_file):
+    """在子进程中处理单个文档，返回完整输出文本，避免多进程打印交错"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        extract_missing_fields(md_file)
+    return buffer.getvalue()
+
+def extract_missing_fields_batch(md_files, max_workers=None):
+    """多进程并行处理多篇Markdown文档（正则扫描为CPU密集型，线程受GIL限制）"""
+    md_files = list(md_files)
+    max_workers = max_workers or min(len(md_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for report in executor.map(extract_missing_fields_report, md_files):
+            print(report, end='')
+            print("\n" + "=" * 80 + "\n")
+
 if __name__ == "__main__":
-    extract_missing_fields()
+    # 命令行给出多个Markdown文件时并行处理，否则处理默认文档
+    if len(sys.argv) > 2:
+        extract_missing_fields_batch(sys.argv[1:])
+    else:
+        extract_missing_fields(*sys.argv[1:])
 
@@ -7,6 +7,7 @@ import sys
 import os
 import re
 import json
+from bisect import bisect_left
 from typing import Dict, Any, List, Tuple
 
 # 添加源代码路径
@@ -14,47 +15,77 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(current_dir, 'src')
 sys.path.insert(0, src_path)
 
+# 扩展的章节识别模式（以 DOTALL 编译："." 跨行匹配，不跨行处写作 [^\n]）
+ENHANCED_PATTERN_SOURCES = {
+    # 传统格式保持不变
+    'abstract_cn': r'((?:中文)?摘\s*要.{100,5000}?)(?=关键词|英文摘要|ABSTRACT|目\s*录)',
+    'abstract_en': r'((?:ABSTRACT|Abstract).{100,5000}?)(?=Keywords?|Key\s+Words?|目\s*录|1\s)',
+    'keywords_cn': r'(关键词[：:\s]*[^\n\r]{5,200})',
+    'keywords_en': r'((?:Keywords?|KEY\s+WORDS?|Key\s+Words?)[：:\s]*[^\n\r]{5,200})',
+    
+    # 增强的目录识别
+    'toc': r'(目\s*录.{100,2000}?)(?=1\s+绪论|1\s|摘\s*要)',
+    
+    # 数字章节格式 - 这是关键改进
+    'chapter_1': r'((?:^|\n)\s*1\s+绪\s*论.{500,10000}?)(?=2\s+|$)',
+    'chapter_2': r'((?:^|\n)\s*2\s+[\u4e00-\u9fff][^\n]*?基础理论.{1000,20000}?)(?=3\s+|$)',
+    'chapter_3': r'((?:^|\n)\s*3\s+[\u4e00-\u9fff][^\n]*?CTA[^\n]*?分割.{1000,15000}?)(?=4\s+|$)',
+    'chapter_4': r'((?:^|\n)\s*4\s+四维动态.{1000,15000}?)(?=5\s+|结\s*论|$)',
+    'chapter_5': r'((?:^|\n)\s*5\s+结\s*论.{200,8000}?)(?=参\s*考\s*文\s*献|致谢|$)',
+    
+    # 传统章节格式作为备选
+    'introduction_alt': r'((?:第一章|第1章|引\s*言|绪\s*论).{500,10000}?)(?=第二章|第2章|2\s)',
+    'literature_alt': r'((?:第二章|第2章|文献综述|相关工作|基础理论).{1000,20000}?)(?=第三章|第3章|3\s)',
+    'methodology_alt': r'((?:第三章|第3章|研究方法|方法论|图像分割).{1000,15000}?)(?=第四章|第4章|4\s)',
+    'results_alt': r'((?:第四章|第4章|实验结果|结果分析|模型构建).{1000,15000}?)(?=第五章|第5章|5\s|结论)',
+    
+    # 其他章节保持不变
+    'conclusion': r'((?:结\s*论|总\s*结|结论与展望).{200,8000}?)(?=参\s*考\s*文\s*献|致谢|附录|$)',
+    'references': r'((?:参\s*考\s*文\s*献|REFERENCES?|References?)(?:\s*\n+\s*(?:\[?\d+\]?|\d+\.|\【\d+】|\(\d+\))\s*.*?)?)(?:\n+\s*(?:致\s*谢|附\s*录|ACKNOWLEDGMENT|$)|$)',
+    'acknowledgement': r'(致\s*谢.{100,2000}?)(?=附录|大连理工大学|$)',
+}
+
+# 模块加载时编译一次
+ENHANCED_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    for name, pattern in ENHANCED_PATTERN_SOURCES.items()
+}
+
+# 预过滤：各模式任一匹配都必然包含的字面量（casefold 后）。全文不含其中任一字面量时
+# 该模式注定失败，直接跳过，省去一次 IGNORECASE 下无法用字面量前缀加速的全文扫描；
+# 未列出的模式没有单一必含字面量，总是执行
+ENHANCED_PATTERN_REQUIRED_LITERALS = {
+    'abstract_cn': ('摘', '要'),
+    'abstract_en': ('abstract',),
+    'keywords_cn': ('关键词',),
+    'keywords_en': ('key', 'word'),
+    'toc': ('目', '录'),
+    'chapter_1': ('绪', '论'),
+    'chapter_2': ('基础理论',),
+    'chapter_3': ('cta', '分割'),
+    'chapter_4': ('四维动态',),
+    'chapter_5': ('结', '论'),
+    'acknowledgement': ('致', '谢'),
+}
+
+NEWLINE_RE = re.compile(r'\n')
+
 def enhanced_chapter_detection(text: str) -> Dict[str, Any]:
     """增强的章节检测，支持多种格式"""
     
     sections = {}
     
-    # 扩展的章节识别模式
-    enhanced_patterns = {
-        # 传统格式保持不变
-        'abstract_cn': r'((?:中文)?摘\s*要[\s\S]{100,5000}?)(?=关键词|英文摘要|ABSTRACT|目\s*录)',
-        'abstract_en': r'((?:ABSTRACT|Abstract)[\s\S]{100,5000}?)(?=Keywords?|Key\s+Words?|目\s*录|1\s)',
-        'keywords_cn': r'(关键词[：:\s]*[^\n\r]{5,200})',
-        'keywords_en': r'((?:Keywords?|KEY\s+WORDS?|Key\s+Words?)[：:\s]*[^\n\r]{5,200})',
-        
-        # 增强的目录识别
-        'toc': r'(目\s*录[\s\S]{100,2000}?)(?=1\s+绪论|1\s|摘\s*要)',
-        
-        # 数字章节格式 - 这是关键改进
-        'chapter_1': r'((?:^|\n)\s*1\s+绪\s*论[\s\S]{500,10000}?)(?=2\s+|$)',
-        'chapter_2': r'((?:^|\n)\s*2\s+[\u4e00-\u9fff].*?基础理论[\s\S]{1000,20000}?)(?=3\s+|$)',
-        'chapter_3': r'((?:^|\n)\s*3\s+[\u4e00-\u9fff].*?CTA.*?分割[\s\S]{1000,15000}?)(?=4\s+|$)',
-        'chapter_4': r'((?:^|\n)\s*4\s+四维动态[\s\S]{1000,15000}?)(?=5\s+|结\s*论|$)',
-        'chapter_5': r'((?:^|\n)\s*5\s+结\s*论[\s\S]{200,8000}?)(?=参\s*考\s*文\s*献|致谢|$)',
-        
-        # 传统章节格式作为备选
-        'introduction_alt': r'((?:第一章|第1章|引\s*言|绪\s*论)[\s\S]{500,10000}?)(?=第二章|第2章|2\s)',
-        'literature_alt': r'((?:第二章|第2章|文献综述|相关工作|基础理论)[\s\S]{1000,20000}?)(?=第三章|第3章|3\s)',
-        'methodology_alt': r'((?:第三章|第3章|研究方法|方法论|图像分割)[\s\S]{1000,15000}?)(?=第四章|第4章|4\s)',
-        'results_alt': r'((?:第四章|第4章|实验结果|结果分析|模型构建)[\s\S]{1000,15000}?)(?=第五章|第5章|5\s|结论)',
-        
-        # 其他章节保持不变
-        'conclusion': r'((?:结\s*论|总\s*结|结论与展望)[\s\S]{200,8000}?)(?=参\s*考\s*文\s*献|致谢|附录|$)',
-        'references': r'((?:参\s*考\s*文\s*献|REFERENCES?|References?)(?:\s*\n+\s*(?:\[?\d+\]?|\d+\.|\【\d+】|\(\d+\))\s*[\s\S]*?)?)(?:\n+\s*(?:致\s*谢|附\s*录|ACKNOWLEDGMENT|$)|$)',
-        'acknowledgement': r'(致\s*谢[\s\S]{100,2000}?)(?=附录|大连理工大学|$)',
-    }
-    
     print("🔍 增强章节检测开始...")
     
     # 识别章节
     detected_sections = {}
-    for section_name, pattern in enhanced_patterns.items():
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+    folded_text = text.casefold()
+    for section_name, pattern in ENHANCED_PATTERNS.items():
+        required = ENHANCED_PATTERN_REQUIRED_LITERALS.get(section_name, ())
+        if not all(literal in folded_text for literal in required):
+            continue
+        
+        match = pattern.search(text)
         if match:
             section_content = match.group(1).strip()
             detected_sections[section_name] = {
@@ -72,36 +103,36 @@ def enhanced_chapter_detection(text: str) -> Dict[str, Any]:
     
     return detected_sections
 
+# 固定标题的章节直接查表
+FIXED_SECTION_TITLES = {
+    'abstract_cn': '摘要',
+    'abstract_en': 'Abstract',
+    'keywords_cn': '关键词',
+    'keywords_en': 'Keywords',
+    'toc': '目录',
+    'conclusion': '结论',
+    'references': '参考文献',
+    'acknowledgement': '致谢',
+}
+# 数字章节标题：编号 + 标题文字
+CHAPTER_TITLE_RE = re.compile(r'(\d+\s+[^\d\n\r]{2,50})')
+
 def extract_chapter_title(content: str, section_name: str) -> str:
     """从章节内容中提取标题"""
     
-    # 首先尝试提取第一行作为标题
-    first_line = content.split('\n')[0].strip()
+    fixed_title = FIXED_SECTION_TITLES.get(section_name)
+    if fixed_title:
+        return fixed_title
+    
+    # 首先尝试提取第一行作为标题（只切出第一行，不拆分整段内容）
+    first_line = content.split('\n', 1)[0].strip()
     
-    # 针对不同类型的章节使用不同的标题提取策略
     if section_name.startswith('chapter_'):
         # 数字章节格式
-        title_match = re.match(r'(\d+\s+[^\d\n\r]{2,50})', first_line)
+        title_match = CHAPTER_TITLE_RE.match(first_line)
         if title_match:
             return title_match.group(1).strip()
     
-    elif section_name == 'abstract_cn':
-        return '摘要'
-    elif section_name == 'abstract_en':
-        return 'Abstract'
-    elif section_name == 'keywords_cn':
-        return '关键词'
-    elif section_name == 'keywords_en':
-        return 'Keywords'
-    elif section_name == 'toc':
-        return '目录'
-    elif section_name == 'conclusion':
-        return '结论'
-    elif section_name == 'references':
-        return '参考文献'
-    elif section_name == 'acknowledgement':
-        return '致谢'
-    
     # 通用标题提取
     if first_line and len(first_line) < 100:
         return first_line
@@ -160,10 +191,12 @@ def analyze_document_structure(file_path: str):
         
         # 生成边界信息
         boundaries = {}
+        # 换行符位置索引只建一次，之后每个位置二分查找行号，不再逐段切片计数
+        newline_offsets = [match.start() for match in NEWLINE_RE.finditer(content)]
         for section_name, section_info in sections.items():
             # 计算行号
-            start_line = content[:section_info['start_pos']].count('\n') + 1
-            end_line = content[:section_info['end_pos']].count('\n') + 1
+            start_line = bisect_left(newline_offsets, section_info['start_pos']) + 1
+            end_line = bisect_left(newline_offsets, section_info['end_pos']) + 1
             
             boundaries[section_name] = {
                 'section_name': section_name,
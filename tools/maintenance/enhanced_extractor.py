@@ -8,17 +8,333 @@ import re
 import json
 import sys
 import os
+import hashlib
+import inspect
+import logging
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from thesis_inno_eval.extract_sections_with_ai import extract_text_from_word, ThesisExtractorPro
 
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+# Python re 的 \s、\d 为Unicode语义（含全角空格、全角数字），RE2 只认ASCII，转换时显式展开
+RE2_SPACE_CLASS = (r'\t\n\x0b\f\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}'
+                   r'\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}')
+RE2_DIGIT_CLASS = r'\p{Nd}'
+# RE2 不支持的语法：前后断言、反向引用
+RE2_UNSUPPORTED_RE = re.compile(r'\(\?<?[=!]|\\\d')
+
+
+def _to_re2_syntax(pattern: str) -> str:
+    """把 \s、\d 改写为与 Python re 一致的Unicode字符类"""
+    parts = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            escape = pattern[i + 1]
+            if escape == 's':
+                parts.append(RE2_SPACE_CLASS if in_class else f'[{RE2_SPACE_CLASS}]')
+            elif escape == 'd':
+                parts.append(RE2_DIGIT_CLASS)
+            else:
+                parts.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+            parts.append(char)
+            # 紧跟 [ 或 [^ 的 ] 是字面量
+            if pattern.startswith('^', i + 1):
+                parts.append('^')
+                i += 1
+            if pattern.startswith(']', i + 1):
+                parts.append(']')
+                i += 1
+        elif char == ']' and in_class:
+            in_class = False
+            parts.append(char)
+        else:
+            parts.append(char)
+        i += 1
+    return ''.join(parts)
+
+
+# 文本抽取与完整抽取结果的磁盘缓存（按内容SHA-256），固定在项目根目录下，与运行时工作目录无关
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+EXTRACT_CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "extract"
+# 完整抽取结果的缓存版本。本模块与 ThesisExtractorPro 所在模块的源码哈希已自动计入缓存键，
+# 其他依赖（如AI客户端、提示词所在模块）改变抽取结果或结果结构时须手动递增，使旧结果失效
+RESULT_CACHE_VERSION = 1
+
+
+def _file_sha256(file_path: str) -> str:
+    """计算文件内容的SHA-256"""
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _result_cache_version() -> str:
+    """完整结果缓存键中的版本部分：RESULT_CACHE_VERSION 与抽取逻辑源码的哈希"""
+    sha256 = hashlib.sha256(str(RESULT_CACHE_VERSION).encode('utf-8'))
+    for source_file in (__file__, inspect.getsourcefile(ThesisExtractorPro)):
+        if source_file:
+            sha256.update(_file_sha256(source_file).encode('ascii'))
+    return sha256.hexdigest()[:16]
+
+
+def _load_cached(cache_key: str):
+    """读取磁盘缓存，未命中或损坏时返回 None"""
+    cache_file = EXTRACT_CACHE_DIR / f"{cache_key}.pkl"
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, value = pickle.load(f)
+        # 校验完整键，防止缓存文件损坏或误命中
+        if cached_key == cache_key:
+            return value
+    except Exception as e:
+        logger.warning("⚠️ 读取抽取缓存失败，重新计算: %s", e)
+    return None
+
+
+def _store_cached(cache_key: str, value) -> None:
+    """写入磁盘缓存；先写临时文件再原子替换，多进程同时写同一键时读方不会读到半个文件。
+    缓存只是加速手段，写入失败（目录不可写、磁盘满、值无法序列化）只记录告警，不影响抽取结果"""
+    try:
+        EXTRACT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=EXTRACT_CACHE_DIR, suffix=".tmp")
+    except OSError as e:
+        logger.warning("⚠️ 写入抽取缓存失败: %s", e)
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((cache_key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, EXTRACT_CACHE_DIR / f"{cache_key}.pkl")
+    except Exception as e:
+        os.unlink(tmp_path)
+        logger.warning("⚠️ 写入抽取缓存失败: %s", e)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# AI候选选择结果缓存：只存通过候选校验后选中的候选项，进程内字典 + 磁盘 pickle
+_LLM_SELECTION_CACHE: Dict[str, str] = {}
+
+
+def _selection_cache_key(field: str, candidates: List[str]) -> str:
+    """同一字段、同一组候选（与顺序无关）对应同一个缓存键"""
+    payload = field + "|" + "|".join(sorted(candidates))
+    return "sel_" + hashlib.blake2b(payload.encode('utf-8'), digest_size=32).hexdigest()
+
+
+def _cached_selection(selection_key: str) -> Optional[str]:
+    """查找已缓存的AI选择结果（先进程内，后磁盘）"""
+    content = _LLM_SELECTION_CACHE.get(selection_key)
+    if content is None:
+        content = _load_cached(selection_key)
+        if content is not None:
+            _LLM_SELECTION_CACHE[selection_key] = content
+    return content
+
+
+def _store_selection(selection_key: str, candidate: str) -> None:
+    """缓存AI选中的候选项"""
+    _LLM_SELECTION_CACHE[selection_key] = candidate
+    _store_cached(selection_key, candidate)
+
+
+@lru_cache(maxsize=64)
+def _extract_text_by_hash(file_path: str, content_sha256: str) -> str:
+    """按内容哈希缓存 extract_text_from_word 结果，进程内 LRU + 磁盘 pickle"""
+    cache_key = f"text_{content_sha256}"
+    text = _load_cached(cache_key)
+    if text is None:
+        text = extract_text_from_word(file_path)
+        if text:
+            _store_cached(cache_key, text)
+    return text
+
+
+def extract_text_cached(file_path: str) -> str:
+    """带缓存的Word文本抽取：文档内容不变时直接复用上次结果"""
+    return _extract_text_by_hash(file_path, _file_sha256(file_path))
+
+
+def _build_literal_automaton(literals):
+    """将字面量构建为 Aho-Corasick 自动机；pyahocorasick 不可用时返回 None"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for literal in literals:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_literal_offsets(text: str, literals: Tuple[str, ...], automaton) -> Dict[str, List[int]]:
+    """单次扫描文本，返回 {字面量: 升序起始位置列表}（允许重叠，如"学生"与"学生姓名"同起点）"""
+    hits = {literal: [] for literal in literals}
+    if automaton is not None:
+        for end, literal in automaton.iter(text):
+            hits[literal].append(end - len(literal) + 1)
+    else:
+        for literal in literals:
+            pos = text.find(literal)
+            while pos != -1:
+                hits[literal].append(pos)
+                pos = text.find(literal, pos + 1)
+    return hits
+
+
+def iter_matches_at(text: str, pattern, starts: List[int]):
+    """只在候选起点做锚定匹配，结果与 pattern.finditer(text) 一致。
+    RE2 每次调用都会重新编码全文，逐点匹配反而更慢，只在有候选时做一次全文扫描"""
+    if not starts:
+        return
+    if not isinstance(pattern, re.Pattern):
+        yield from pattern.finditer(text)
+        return
+    last_end = 0
+    for start in starts:
+        if start < last_end:
+            continue
+        match = pattern.match(text, start)
+        if match:
+            last_end = match.end()
+            yield match
+
+
+def compile_locate_pattern(pattern: str, flags: int = 0):
+    """定位模式优先用 RE2 编译（线性时间，无回溯）；RE2 不可用或不支持该语法时回退到 re。
+    两者都提供 findall，调用方无需区分"""
+    if RE2_AVAILABLE and not RE2_UNSUPPORTED_RE.search(pattern):
+        inline_flags = ('m' if flags & re.MULTILINE else '') + ('i' if flags & re.IGNORECASE else '')
+        prefix = f'(?{inline_flags})' if inline_flags else ''
+        try:
+            return re2.compile(prefix + _to_re2_syntax(pattern))
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 class EnhancedThesisExtractor(ThesisExtractorPro):
     """增强版论文提取器 - 精准定位 + AI智能识别"""
     
+    # 各字段的精准定位模式：(模式, 起始字面量)，类加载时编译一次（MULTILINE | IGNORECASE），
+    # 可用时交给 RE2。起始字面量为小写，任何匹配都必然以其中之一开头（忽略大小写）；
+    # 为 None 的模式没有固定开头，总是全文扫描
+    CANDIDATE_PATTERNS: Dict[str, Tuple[Tuple[Any, Optional[Tuple[str, ...]]], ...]] = {
+        field: tuple(
+            (compile_locate_pattern(pattern, re.MULTILINE | re.IGNORECASE), start_literals)
+            for pattern, start_literals in patterns
+        )
+        for field, patterns in {
+            # 学号精准定位
+            'ThesisNumber': (
+                (r'学号[：:\s]*([A-Z0-9]{10,20})', ('学号',)),
+                (r'学生证号[：:\s]*([A-Z0-9]{10,20})', ('学生证号',)),
+                (r'(?:Student\s+)?(?:ID|Number)[：:\s]*([A-Z0-9]{10,20})', ('student', 'id', 'number')),
+            ),
+            # 中文标题精准定位
+            'ChineseTitle': (
+                # 分隔符 [：:\s]* 已包含换行，不再接 \n*：两者重叠会在长空行串上产生平方级回溯
+                (r'(?:论文题目|题目|Title)[：:\s]*([^\n\r]{10,200}?)(?:\n|$)', ('论文题目', '题目', 'title')),
+                (r'^([^A-Za-z\n\r]{10,100})$', None),  # 独立行的中文标题
+                (r'(?:中文题目|Chinese\s+Title)[：:\s]*([^\n\r]{10,200})', ('中文题目', 'chinese')),
+            ),
+            # 作者姓名精准定位
+            'ChineseAuthor': (
+                (r'(?:作者|姓名|学生姓名)[：:\s]*([^\d\n\r]{2,10})(?:\s|$)', ('作者', '姓名', '学生姓名')),
+                (r'(?:研究生|学生)[：:\s]*([^\d\n\r]{2,10})(?:\s|$)', ('研究生', '学生')),
+                (r'(?:Student|Author)[：:\s]*([^\d\n\r]{2,10})(?:\s|$)', ('student', 'author')),
+            ),
+            # 英文标题精准定位
+            'EnglishTitle': (
+                (r'(?:English\s+Title|TITLE)[：:\s]*([A-Za-z\s\-:]{15,200}?)(?:\n|$)', ('english', 'title')),
+                (r'^([A-Z][A-Za-z\s\-:]{15,200})$', None),  # 独立行的英文标题
+            ),
+            # 英文作者精准定位
+            'EnglishAuthor': (
+                (r'(?:English\s+)?(?:Author|Name|By)[：:\s]*([A-Za-z\s]{3,30})(?:\n|$)', ('english', 'author', 'name', 'by')),
+                (r'(?:Student|Candidate)[：:\s]*([A-Za-z\s]{3,30})(?:\n|$)', ('student', 'candidate')),
+            ),
+            # 大学名称精准定位
+            'ChineseUniversity': (
+                (r'([^A-Za-z\n\r]*大学)(?!\s*学位)', None),
+                (r'([^A-Za-z\n\r]*学院)(?!\s*专业)', None),
+                (r'(Beijing\s+University[^,\n]*)', ('beijing',)),
+                (r'(Beihang\s+University[^,\n]*)', ('beihang',)),
+            ),
+        }.items()
+    }
+    
+    # 所有起始字面量，用于一次扫描定位候选起点
+    START_LITERALS: Tuple[str, ...] = tuple(dict.fromkeys(
+        literal
+        for patterns in CANDIDATE_PATTERNS.values()
+        for _, start_literals in patterns
+        for literal in start_literals or ()
+    ))
+    START_LITERAL_AUTOMATON = _build_literal_automaton(START_LITERALS)
+    
+    # 候选定位的搜索范围：论文前置部分（封面、题名页、声明等）
+    FRONT_MATTER_CHARS = 20000
+    
+    # 字段值开头需要移除的常见标签文字：各类标签按固定顺序依次可选出现，中间允许空白，
+    # 一次 sub 的效果等同于逐个模式 sub 再 strip
+    LABEL_PREFIX_RE = re.compile(
+        r'^(?:(?:学号|姓名|作者|标题|题目)[：:\s]*)?\s*'
+        r'(?:(?:Student|Author|Title|Name)[：:\s]*)?\s*'
+        r'(?:(?:专业|学院|大学)[：:\s]*)?\s*'
+        r'(?:(?:Major|College|University)[：:\s]*)?\s*'
+        r'(?:\*\*[^*]+\*\*[：:\s]*)?\s*'  # Markdown标记
+        r'[\d\.\s]*',  # 前导数字
+        re.IGNORECASE
+    )
+    
+    # LABEL_PREFIX_RE 非空匹配可能的首字符（忽略大小写，含 ſ）；另加任意空白与数字
+    LABEL_FIRST_CHARS = frozenset('学姓作标题专大*.SATNMCUsatnmcuſ')
+    
+    # 特定字段的清理模式
+    AUTHOR_NOISE_RE = re.compile(r'(?:姓名|学生|研究生)')
+    UNIVERSITY_CORE_RE = re.compile(r'([^，,\n\r]*大学)')
+    CONVERSION_TIME_RE = re.compile(r'\*\*转换时间\*\*[^*]*')
+    LEADING_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}.*')
+    
     def __init__(self):
         super().__init__()
+        # 标准字段数在实例生命周期内不变，只计算一次
+        self._n_standard = len(self.standard_fields)
         self.ai_client = None
+        # 本次提取中是否有AI选择失败（调用异常或空应答）；失败时结果不写入缓存
+        self._ai_failed = False
         self._init_ai_client()
         
     def _init_ai_client(self):
@@ -26,9 +342,9 @@ class EnhancedThesisExtractor(ThesisExtractorPro):
         try:
             from thesis_inno_eval.ai_client import get_ai_client
             self.ai_client = get_ai_client()
-            print(" AI客户端初始化成功")
+            logger.info(" AI客户端初始化成功")
         except Exception as e:
-            print(f"⚠️ AI客户端初始化失败: {e}")
+            logger.warning("⚠️ AI客户端初始化失败: %s", e)
             self.ai_client = None
     
     def extract_with_ai_enhanced_strategy(self, text: str, file_path: Optional[str] = None) -> Dict[str, Any]:
@@ -38,107 +354,106 @@ class EnhancedThesisExtractor(ThesisExtractorPro):
         2. AI智能识别和清理
         3. 多重验证
         """
-        print("🚀 启动AI增强版论文信息提取系统")
-        print("=" * 60)
+        logger.info("🚀 启动AI增强版论文信息提取系统")
+        logger.info("=" * 60)
+        
+        # 同一文本、同一提取模式（AI/降级）的结果直接复用，跳过步骤1-4
+        mode = 'ai' if self.ai_client else 'fallback'
+        cache_key = f"result_{_result_cache_version()}_{mode}_{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+        cached_result = _load_cached(cache_key)
+        if cached_result is not None:
+            logger.info("💾 使用缓存的提取结果")
+            self._generate_enhanced_report(cached_result, file_path)
+            return cached_result
+        
+        self._ai_failed = False
         
         # 步骤1: 基础抽取 + 精准定位
-        print("🎯 步骤1: 精准定位候选信息")
+        logger.info("🎯 步骤1: 精准定位候选信息")
         candidates = self._precise_locate_candidates(text)
         
         # 步骤2: AI智能识别和清理
-        print("🧠 步骤2: AI智能识别和清理")
-        if self.ai_client:
+        logger.info("🧠 步骤2: AI智能识别和清理")
+        # 每个字段至多一个候选时没有需要AI选择的内容，两条路径结果相同，直接走降级清理
+        if self.ai_client and any(len(values) > 1 for values in candidates.values()):
             refined_result = self._ai_refine_extraction(candidates, text)
         else:
             refined_result = self._fallback_refine_extraction(candidates)
         
         # 步骤3: 多重验证
-        print("🔍 步骤3: 多重验证和修复")
+        logger.info("🔍 步骤3: 多重验证和修复")
         final_result = self._multi_layer_validation(refined_result, text)
         
         # 步骤4: 补充提取
-        print("📄 步骤4: 补充内容提取")
+        logger.info("📄 步骤4: 补充内容提取")
         final_result = self._supplement_extraction(final_result, text)
         
+        # AI选择失败时字段已降级为最长候选，这样的结果不能记在 'ai' 模式下，下次重新调用AI
+        if self._ai_failed:
+            logger.info("⚠️ 本次有AI选择失败，提取结果不写入缓存")
+        else:
+            _store_cached(cache_key, final_result)
         self._generate_enhanced_report(final_result, file_path)
         
         return final_result
     
     def _precise_locate_candidates(self, text: str) -> Dict[str, List[str]]:
         """精准定位候选信息"""
-        candidates = {}
-        
-        # 学号精准定位
-        thesis_number_patterns = [
-            r'学号[：:\s]*([A-Z0-9]{10,20})',
-            r'学生证号[：:\s]*([A-Z0-9]{10,20})',
-            r'(?:Student\s+)?(?:ID|Number)[：:\s]*([A-Z0-9]{10,20})',
-        ]
-        candidates['ThesisNumber'] = self._extract_by_patterns(text, thesis_number_patterns)
-        
-        # 中文标题精准定位
-        chinese_title_patterns = [
-            r'(?:论文题目|题目|Title)[：:\s]*\n*([^\n\r]{10,200}?)(?:\n|$)',
-            r'^([^A-Za-z\n\r]{10,100})$',  # 独立行的中文标题
-            r'(?:中文题目|Chinese\s+Title)[：:\s]*([^\n\r]{10,200})',
-        ]
-        candidates['ChineseTitle'] = self._extract_by_patterns(text, chinese_title_patterns)
-        
-        # 作者姓名精准定位
-        chinese_author_patterns = [
-            r'(?:作者|姓名|学生姓名)[：:\s]*([^\d\n\r]{2,10})(?:\s|$)',
-            r'(?:研究生|学生)[：:\s]*([^\d\n\r]{2,10})(?:\s|$)',
-            r'(?:Student|Author)[：:\s]*([^\d\n\r]{2,10})(?:\s|$)',
-        ]
-        candidates['ChineseAuthor'] = self._extract_by_patterns(text, chinese_author_patterns)
-        
-        # 英文标题精准定位
-        english_title_patterns = [
-            r'(?:English\s+Title|TITLE)[：:\s]*\n*([A-Za-z\s\-:]{15,200}?)(?:\n|$)',
-            r'^([A-Z][A-Za-z\s\-:]{15,200})$',  # 独立行的英文标题
-        ]
-        candidates['EnglishTitle'] = self._extract_by_patterns(text, english_title_patterns)
-        
-        # 英文作者精准定位
-        english_author_patterns = [
-            r'(?:English\s+)?(?:Author|Name|By)[：:\s]*([A-Za-z\s]{3,30})(?:\n|$)',
-            r'(?:Student|Candidate)[：:\s]*([A-Za-z\s]{3,30})(?:\n|$)',
-        ]
-        candidates['EnglishAuthor'] = self._extract_by_patterns(text, english_author_patterns)
-        
-        # 大学名称精准定位
-        university_patterns = [
-            r'([^A-Za-z\n\r]*大学)(?!\s*学位)',
-            r'([^A-Za-z\n\r]*学院)(?!\s*专业)',
-            r'(Beijing\s+University[^,\n]*)',
-            r'(Beihang\s+University[^,\n]*)',
-        ]
-        candidates['ChineseUniversity'] = self._extract_by_patterns(text, university_patterns)
-        
-        print(f"   📍 候选信息定位完成: {len(candidates)} 个字段")
-        for field, values in candidates.items():
-            if values:
-                print(f"      {field}: {len(values)} 个候选")
+        # 这些字段都位于封面/前置部分，只在文档开头一段内定位
+        front_matter = text[:self.FRONT_MATTER_CHARS]
+        # 起始字面量在 casefold 后的文本上一次扫描定位；casefold 改变长度（如含 ß）时
+        # 偏移无法与原文对应，退回逐模式全文扫描
+        folded = front_matter.casefold()
+        literal_hits = None
+        if len(folded) == len(front_matter):
+            literal_hits = find_literal_offsets(folded, self.START_LITERALS, self.START_LITERAL_AUTOMATON)
+        candidates = {
+            field: self._extract_by_patterns(front_matter, patterns, literal_hits=literal_hits)
+            for field, patterns in self.CANDIDATE_PATTERNS.items()
+        }
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("   📍 候选信息定位完成: %d 个字段", len(candidates))
+            for field, values in candidates.items():
+                if values:
+                    logger.info("      %s: %d 个候选", field, len(values))
         
         return candidates
     
-    def _extract_by_patterns(self, text: str, patterns: List[str]) -> List[str]:
-        """使用多个模式提取候选值"""
+    def _extract_by_patterns(self, text: str, patterns: Tuple[Tuple[Any, Optional[Tuple[str, ...]]], ...],
+                             max_per_pattern: int = 5,
+                             literal_hits: Optional[Dict[str, List[int]]] = None) -> List[str]:
+        """使用多个预编译模式提取候选值；逐个迭代匹配，每个模式得到 max_per_pattern 个候选后即停止。
+        给出 literal_hits 时，有起始字面量的模式只在字面量出现处匹配"""
         candidates = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
+        seen = set()  # 去重用集合，保持候选的首次出现顺序
+        for pattern, start_literals in patterns:
+            if start_literals is not None and literal_hits is not None:
+                starts = sorted(set().union(*(literal_hits[literal] for literal in start_literals)))
+                matches = iter_matches_at(text, pattern, starts)
+            else:
+                matches = pattern.finditer(text)
+            # 与 findall 相同：有分组时取第一个分组；分组号每个模式只判断一次
+            group = 1 if pattern.groups else 0
+            found = 0
             for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                cleaned = match.strip()
-                if len(cleaned) > 1 and cleaned not in candidates:
+                cleaned = match.group(group).strip()
+                if len(cleaned) > 1 and cleaned not in seen:
+                    seen.add(cleaned)
                     candidates.append(cleaned)
+                    found += 1
+                    if found >= max_per_pattern:
+                        break
         return candidates
     
     def _ai_refine_extraction(self, candidates: Dict[str, List[str]], text: str) -> Dict[str, Any]:
         """使用AI智能识别和清理抽取结果"""
         refined = {}
         
+        # 所有多候选字段合并为一次AI调用，未能批量选出的字段再逐个选择
+        ambiguous = {field: candidate_list for field, candidate_list in candidates.items() if len(candidate_list) > 1}
+        selections = self._ai_select_best_candidates_batch(ambiguous)
+        
         for field, candidate_list in candidates.items():
             if not candidate_list:
                 refined[field] = ""
@@ -149,25 +464,94 @@ class EnhancedThesisExtractor(ThesisExtractorPro):
                 refined[field] = self._clean_field_value(candidate_list[0], field)
             else:
                 # 多个候选，使用AI选择最佳
-                best_candidate = self._ai_select_best_candidate(field, candidate_list, text)
+                best_candidate = selections.get(field) or self._ai_select_best_candidate(field, candidate_list, text)
                 refined[field] = self._clean_field_value(best_candidate, field)
             
             if refined[field]:
-                print(f"    {field}: {refined[field]}")
+                logger.info("    %s: %s", field, refined[field])
         
         return refined
     
+    def _ai_select_best_candidates_batch(self, ambiguous: Dict[str, List[str]]) -> Dict[str, str]:
+        """一次AI调用为多个字段选择最佳候选，返回 {字段: 选中的候选}；
+        已有缓存的字段不再询问，应答解析失败时返回空字典，由调用方逐字段回退"""
+        if not self.ai_client:
+            return {}
+        
+        pending = {
+            field: candidate_list for field, candidate_list in ambiguous.items()
+            if _cached_selection(_selection_cache_key(field, candidate_list)) is None
+        }
+        # 只剩一个字段时与逐字段调用次数相同，交给原有流程
+        if len(pending) < 2:
+            return {}
+        
+        candidate_blocks = "\n\n".join(
+            f'"{field}" 的候选项：\n' + "\n".join(f"{i+1}. {c}" for i, c in enumerate(candidate_list))
+            for field, candidate_list in pending.items()
+        )
+        # 固定的选择规则放在前面，各文档的提示词共享同一前缀
+        prompt = f"""
+请为下列每个字段分别从其候选项中选择最符合字段要求的内容。
+
+要求：
+- 如果是标题，选择最完整、最正式的标题
+- 如果是姓名，选择最干净、没有标签的姓名
+- 如果是学校名称，选择最标准的校名
+- 只返回一个JSON对象，键为字段名，值为选中的内容，不要包含序号或解释
+
+{candidate_blocks}
+
+返回JSON："""
+        
+        selections = {}
+        try:
+            response = self.ai_client.send_message(prompt)
+            if not (response and response.content):
+                return {}
+            content = response.content.strip()
+            if content.startswith('```json'):
+                content = content[7:]
+            if content.endswith('```'):
+                content = content[:-3]
+            chosen = json.loads(content.strip())
+            if not isinstance(chosen, dict):
+                return {}
+            
+            for field, candidate_list in pending.items():
+                result = chosen.get(field)
+                if not isinstance(result, str) or not result.strip():
+                    continue
+                result = result.strip()
+                # 验证结果是否在候选项中
+                for candidate in candidate_list:
+                    if candidate in result or result in candidate:
+                        selections[field] = candidate
+                        _store_selection(_selection_cache_key(field, candidate_list), candidate)
+                        break
+        except Exception as e:
+            logger.warning("   ⚠️ AI批量选择失败，逐字段选择: %s", e)
+        
+        return selections
+    
     def _ai_select_best_candidate(self, field: str, candidates: List[str], context: str) -> str:
         """使用AI从多个候选中选择最佳结果"""
         if not self.ai_client or not candidates:
             return candidates[0] if candidates else ""
         
         try:
+            # 相同候选组合的选择只调用一次AI，进程内与跨进程复用选中的候选；命中缓存时不再构建提示词
+            selection_key = _selection_cache_key(field, candidates)
+            cached = _cached_selection(selection_key)
+            if cached is not None:
+                return cached
+            
+            options = "\n".join(f"{i+1}. {c}" for i, c in enumerate(candidates))
             prompt = f"""
 请从以下候选项中选择最符合"{field}"字段要求的内容：
 
 候选项：
-{chr(10).join([f"{i+1}. {c}" for i, c in enumerate(candidates)])}
+{options}
 
 要求：
 - 如果是标题，选择最完整、最正式的标题
@@ -178,15 +562,20 @@ class EnhancedThesisExtractor(ThesisExtractorPro):
 选择结果："""
 
             response = self.ai_client.send_message(prompt)
-            if response and response.content:
-                result = response.content.strip()
-                # 验证结果是否在候选项中
+            content = response.content if response and response.content else None
+            if not content:
+                self._ai_failed = True
+            else:
+                result = content.strip()
+                # 验证结果是否在候选项中；只缓存通过验证的候选，不合规的应答下次重新询问
                 for candidate in candidates:
                     if candidate in result or result in candidate:
+                        _store_selection(selection_key, candidate)
                         return candidate
             
         except Exception as e:
-            print(f"   ⚠️ AI选择失败: {e}")
+            self._ai_failed = True
+            logger.warning("   ⚠️ AI选择失败: %s", e)
         
         # 降级策略：选择最长的候选项
         return max(candidates, key=len) if candidates else ""
@@ -197,32 +586,26 @@ class EnhancedThesisExtractor(ThesisExtractorPro):
             return ""
         
         # 移除常见的标签文字
-        label_patterns = [
-            r'^(?:学号|姓名|作者|标题|题目)[：:\s]*',
-            r'^(?:Student|Author|Title|Name)[：:\s]*',
-            r'^(?:专业|学院|大学)[：:\s]*',
-            r'^(?:Major|College|University)[：:\s]*',
-            r'^\*\*[^*]+\*\*[：:\s]*',  # Markdown标记
-            r'^[\d\.\s]*',  # 前导数字
-        ]
-        
-        cleaned = value
-        for pattern in label_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE).strip()
+        # 首字符不可能开始一个标签时标签正则必然空匹配，直接跳过
+        first_char = value[0]
+        if first_char in self.LABEL_FIRST_CHARS or first_char.isspace() or first_char.isdecimal():
+            cleaned = self.LABEL_PREFIX_RE.sub('', value, count=1).strip()
+        else:
+            cleaned = value.strip()
         
         # 特定字段的清理
         if field == 'ChineseAuthor':
             # 移除可能的多余文字
-            cleaned = re.sub(r'(?:姓名|学生|研究生)', '', cleaned).strip()
+            cleaned = self.AUTHOR_NOISE_RE.sub('', cleaned).strip()
         elif field == 'ChineseUniversity':
             # 保留核心大学名称
-            match = re.search(r'([^，,\n\r]*大学)', cleaned)
+            match = self.UNIVERSITY_CORE_RE.search(cleaned)
             if match:
                 cleaned = match.group(1)
         elif field in ['ChineseTitle', 'EnglishTitle']:
             # 移除转换时间等无关信息
-            cleaned = re.sub(r'\*\*转换时间\*\*[^*]*', '', cleaned)
-            cleaned = re.sub(r'^\d{4}-\d{2}-\d{2}.*', '', cleaned)
+            cleaned = self.CONVERSION_TIME_RE.sub('', cleaned)
+            cleaned = self.LEADING_DATE_RE.sub('', cleaned)
         
         return cleaned.strip()
     
@@ -241,63 +624,112 @@ class EnhancedThesisExtractor(ThesisExtractorPro):
                 best = max(candidate_list, key=len, default="")
             elif field in ['ChineseAuthor', 'EnglishAuthor']:
                 # 姓名选择最短的（通常更干净）
-                best = min([c for c in candidate_list if len(c) > 1], key=len, default="")
+                best = min((c for c in candidate_list if len(c) > 1), key=len, default="")
             else:
                 # 其他字段选择第一个
                 best = candidate_list[0]
             
             refined[field] = self._clean_field_value(best, field)
             if refined[field]:
-                print(f"    {field}: {refined[field]}")
+                logger.info("    %s: %s", field, refined[field])
         
         return refined
     
     def _multi_layer_validation(self, result: Dict[str, Any], text: str) -> Dict[str, Any]:
-        """多层次验证和修复"""
-        validated = result.copy()
+        """多层次验证和修复；目前只检查并告警，不修改结果，因此直接返回原字典而不复制"""
+        validated = result
         
         # 验证学号格式
         if validated.get('ThesisNumber'):
             thesis_num = validated['ThesisNumber']
             if not re.match(r'^[A-Z0-9]{8,20}$', thesis_num):
-                print(f"   ⚠️ 学号格式可能有误: {thesis_num}")
+                logger.warning("   ⚠️ 学号格式可能有误: %s", thesis_num)
         
         # 验证姓名合理性
         if validated.get('ChineseAuthor'):
             author = validated['ChineseAuthor']
             if len(author) < 2 or len(author) > 8:
-                print(f"   ⚠️ 中文姓名长度异常: {author}")
+                logger.warning("   ⚠️ 中文姓名长度异常: %s", author)
         
         # 验证标题长度
         if validated.get('ChineseTitle'):
             title = validated['ChineseTitle']
             if len(title) < 10:
-                print(f"   ⚠️ 中文标题可能不完整: {title}")
+                logger.warning("   ⚠️ 中文标题可能不完整: %s", title)
         
         return validated
     
     def _supplement_extraction(self, result: Dict[str, Any], text: str) -> Dict[str, Any]:
         """补充提取其他字段"""
-        # 使用父类方法补充其他内容
-        parent_result = super().extract_with_integrated_strategy(text)
+        missing_fields = [field for field in self.standard_fields if not result.get(field)]
+        if not missing_fields:
+            # AI增强结果已覆盖所有字段，无需再跑一遍父类的完整抽取
+            return result
+        
+        # 使用父类方法补充其他内容；同一文本对象只抽取一次（保留引用，避免 id 被复用）
+        if getattr(self, '_parent_result_text', None) is not text:
+            self._parent_result = super().extract_with_integrated_strategy(text)
+            self._parent_result_text = text
+        parent_result = self._parent_result
         
         # 合并结果，优先使用AI增强的结果
-        for field in self.standard_fields:
-            if field not in result or not result[field]:
-                if field in parent_result and parent_result[field]:
-                    result[field] = parent_result[field]
+        for field in missing_fields:
+            if parent_result.get(field):
+                result[field] = parent_result[field]
         
         return result
     
     def _generate_enhanced_report(self, result: Dict[str, Any], file_path: Optional[str]):
         """生成增强版提取报告"""
-        non_empty_count = sum(1 for v in result.values() if v and str(v).strip())
-        confidence = non_empty_count / len(self.standard_fields)
-        
-        print(f"\n AI增强提取完成")
-        print(f"📊 提取字段数: {non_empty_count}/{len(self.standard_fields)}")
-        print(f"📈 完整度: {confidence:.1%}")
-        print(f"🎖️ 置信度: {confidence:.2f}")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        # 字符串值直接 strip，非字符串值只看真假，不再逐个 str() 转换
+        non_empty_count = sum(1 for v in result.values()
+                              if v and (v.strip() if isinstance(v, str) else True))
+        confidence = non_empty_count / self._n_standard
+        
+        logger.info("\n AI增强提取完成")
+        logger.info("📊 提取字段数: %d/%d", non_empty_count, self._n_standard)
+        logger.info("📈 完整度: %.1f%%", confidence * 100)
+        logger.info("🎖️ 置信度: %.2f", confidence)
+
+
+# 批量提取：每个工作进程只创建一个提取器（含AI客户端初始化），处理分到该进程的所有文件
+_worker_extractor: Optional[EnhancedThesisExtractor] = None
+
+
+def _worker_init():
+    """工作进程初始化：创建本进程共用的提取器"""
+    global _worker_extractor
+    _worker_extractor = EnhancedThesisExtractor()
+
+
+def _extract_one(file_path: str) -> Optional[Dict[str, Any]]:
+    """用本进程的提取器处理单个文件；失败时记录日志并返回 None，不影响其他文件"""
+    try:
+        text = extract_text_cached(file_path)
+        if not text:
+            logger.warning("❌ 文档文本提取失败: %s", file_path)
+            return None
+        return _worker_extractor.extract_with_ai_enhanced_strategy(text, file_path)
+    except Exception:
+        logger.exception("❌ 增强版提取失败: %s", file_path)
+        return None
+
+
+def batch_extract(paths: List[str], max_workers: Optional[int] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+    """批量提取多篇论文，返回 {文件路径: 提取结果}（失败为 None）。
+    提取以正则扫描为主，属CPU密集型，按文件分配到多个进程；文本与结果缓存按内容哈希存盘，各进程共享"""
+    paths = list(paths)
+    if not paths:
+        return {}
+    max_workers = max_workers or min(len(paths), os.cpu_count() or 1)
+    if max_workers <= 1:
+        # 单进程时不必启动进程池，直接在当前进程复用一个提取器
+        _worker_init()
+        return {path: _extract_one(path) for path in paths}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init) as executor:
+        return dict(zip(paths, executor.map(_extract_one, paths)))
 
 
 def test_enhanced_extraction():
@@ -315,7 +747,7 @@ def test_enhanced_extraction():
     try:
         # 提取文档文本
         print("📄 提取文档文本...")
-        text = extract_text_from_word(file_path)
+        text = extract_text_cached(file_path)
         
         if not text:
             print("❌ 文档文本提取失败")
@@ -361,5 +793,12 @@ def test_enhanced_extraction():
 
 
 if __name__ == "__main__":
-    test_enhanced_extraction()
+    # 进度信息走 logging，LOGLEVEL=WARNING 时只输出告警
+    logging.basicConfig(level=os.environ.get('LOGLEVEL', 'INFO').upper(), format='%(message)s')
+    # 命令行给出Word文档时批量并行处理，否则运行单文件测试
+    if len(sys.argv) > 1:
+        for path, result in batch_extract(sys.argv[1:]).items():
+            print(json.dumps({'file_path': path, 'extracted_info': result}, ensure_ascii=False))
+    else:
+        test_enhanced_extraction()
 
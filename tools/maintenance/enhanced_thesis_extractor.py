@@ -7,10 +7,43 @@
 import os
 import re
 import json
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+# 章节结束位置的判定模式
+ABSTRACT_CN_END_RE = re.compile(r'关键词|keywords?|abstract', re.IGNORECASE)
+ABSTRACT_EN_END_RE = re.compile(r'key[^\S\n]*words?|目[^\S\n]*录', re.IGNORECASE)
+TOC_END_RE = re.compile(r'第一章|第1章|绪论|引言', re.IGNORECASE)
+REFERENCES_END_RE = re.compile(r'致谢|攻读.*学位.*期间|个人简历|附录', re.IGNORECASE)
+DEFAULT_END_RE = re.compile(r'第.*章|^[A-Z\s]{3,20}$')
+# 各类章节的结束标记及向后查找的行数上限（None 表示查找到文档末尾）；标记均不跨行，可在全文上扫描
+SECTION_END_MARKERS = {
+    'abstract_cn': (ABSTRACT_CN_END_RE, 100),
+    'abstract_en': (ABSTRACT_EN_END_RE, 100),
+    'toc': (TOC_END_RE, 200),
+    'references': (REFERENCES_END_RE, None),
+}
+# 参考文献的结束标记只认短行（strip 后不足50字符），避免正文中提到"致谢"等词
+REFERENCES_END_MAX_LEN = 50
+
+# 结构化内容提取模式
+ABSTRACT_CN_SKIP_RE = re.compile(r'关键词|keywords?', re.IGNORECASE)
+ABSTRACT_EN_SKIP_RE = re.compile(r'key\s*words?', re.IGNORECASE)
+KEYWORDS_CN_RE = re.compile(r'关键词[：:](.*?)(?:\n|$)', re.IGNORECASE | re.DOTALL)
+KEYWORDS_EN_RE = re.compile(r'key\s*words?[：:](.*?)(?:\n|$)', re.IGNORECASE | re.DOTALL)
+TOC_ENTRY_RE = re.compile(r'第.*章|[0-9]+\.[0-9]+|###')
+
+# 忽略大小写匹配时，小写后仍会与ASCII字母相等（或小写后变成多个字符）的特殊字母
+CASE_FOLD_SPECIAL_CHARS = 'ſıİ'
+
+# 参考文献：第一条 [1] 所在行（在全文上一次搜索，行首空白与 strip 一致但不跨行）、条目行、结束标记
+REF_FIRST_ENTRY_RE = re.compile(r'^[^\S\n]*\[[^\S\n]*1[^\S\n]*\]', re.MULTILINE)
+REF_ENTRY_RE = re.compile(r'^\[\s*\d+\s*\]')
+REF_END_RE = re.compile(r'致谢|攻读.*学位.*期间|个人简历|附录|声明')
+
 @dataclass
 class DocumentSection:
     """文档段落信息"""
@@ -35,103 +68,118 @@ class EnhancedThesisExtractor:
     def __init__(self):
         self.field_patterns = self._init_field_patterns()
         self.section_patterns = self._init_section_patterns()
+        # 章节模式的全文版本：\s 不跨行，使每个匹配都落在单行之内
+        self.section_scan_patterns = {
+            section: [re.compile(p.pattern.replace(r'\s', r'[^\S\n]'), p.flags) for p in patterns]
+            for section, patterns in self.section_patterns.items()
+        }
+        # 区分大小写的版本，只用于已转小写的全文：不忽略大小写时 re 可对字面量做快速查找
+        self.section_scan_patterns_lower = {
+            section: [re.compile(p.pattern) for p in patterns]
+            for section, patterns in self.section_scan_patterns.items()
+        }
         self.expected_fields = self._init_expected_fields()
     
-    def _init_field_patterns(self) -> Dict[str, List[str]]:
-        """初始化字段匹配模式"""
-        return {
+    def _init_field_patterns(self) -> Dict[str, List[Tuple[re.Pattern, Optional[Tuple[str, ...]]]]]:
+        """初始化字段匹配模式：(预编译模式, 必含字面量)，MULTILINE | IGNORECASE。
+        必含字面量为小写，任何匹配都至少包含其中之一；为 None 的模式总是执行"""
+        patterns = {
             'ThesisNumber': [
-                r'论文编号[:：]\s*(\S+)',
-                r'编\s*号[:：]\s*(\S+)',
-                r'学位论文编号[:：]\s*(\S+)'
+                (r'论文编号[:：]\s*(\S+)', ('论文编号',)),
+                (r'编\s*号[:：]\s*(\S+)', ('编',)),
+                (r'学位论文编号[:：]\s*(\S+)', ('学位论文编号',))
             ],
             'ChineseTitle': [
-                r'(?:论文)?题目[:：]\s*(.+)',
-                r'中文题目[:：]\s*(.+)',
-                r'^([^:\n]{15,80}研究[^:\n]*)$',  # 独立行的研究标题
-                r'^([^:\n]{10,60}(?:分析|设计|系统|方法|技术)[^:\n]*)$'
+                (r'(?:论文)?题目[:：]\s*(.+)', ('题目',)),
+                (r'中文题目[:：]\s*(.+)', ('中文题目',)),
+                (r'^([^:\n]{15,80}研究[^:\n]*)$', ('研究',)),  # 独立行的研究标题
+                (r'^([^:\n]{10,60}(?:分析|设计|系统|方法|技术)[^:\n]*)$', ('分析', '设计', '系统', '方法', '技术'))
             ],
             'EnglishTitle': [
-                r'英文题目[:：]\s*(.+)',
-                r'English Title[:：]\s*(.+)',
-                r'^([A-Z][A-Za-z\s,:-]{20,100})$'  # 英文标题格式
+                (r'英文题目[:：]\s*(.+)', ('英文题目',)),
+                (r'English Title[:：]\s*(.+)', ('english title',)),
+                (r'^([A-Z][A-Za-z\s,:-]{20,100})$', None)  # 英文标题格式
             ],
             'ChineseAuthor': [
-                r'作者姓名[:：]\s*(.+)',
-                r'姓\s*名[:：]\s*(.+)',
-                r'申请人[:：]\s*(.+)',
-                r'学\s*生[:：]\s*(.+)',
-                r'研究生[:：]\s*(.+)'
+                (r'作者姓名[:：]\s*(.+)', ('作者姓名',)),
+                (r'姓\s*名[:：]\s*(.+)', ('姓',)),
+                (r'申请人[:：]\s*(.+)', ('申请人',)),
+                (r'学\s*生[:：]\s*(.+)', ('学',)),
+                (r'研究生[:：]\s*(.+)', ('研究生',))
             ],
             'EnglishAuthor': [
-                r'Author[:：]\s*(.+)',
-                r'Candidate[:：]\s*(.+)',
-                r'Student[:：]\s*(.+)',
-                r'Name[:：]\s*(.+)'
+                (r'Author[:：]\s*(.+)', ('author',)),
+                (r'Candidate[:：]\s*(.+)', ('candidate',)),
+                (r'Student[:：]\s*(.+)', ('student',)),
+                (r'Name[:：]\s*(.+)', ('name',))
             ],
             'ChineseUniversity': [
-                r'培养单位[:：]\s*(.+)',
-                r'学校[:：]\s*(.+)',
-                r'单位[:：]\s*(.+)',
-                r'院校[:：]\s*(.+)',
-                r'(\w+大学)',
-                r'(\w+学院)(?![\w学科专业])'
+                (r'培养单位[:：]\s*(.+)', ('培养单位',)),
+                (r'学校[:：]\s*(.+)', ('学校',)),
+                (r'单位[:：]\s*(.+)', ('单位',)),
+                (r'院校[:：]\s*(.+)', ('院校',)),
+                (r'(\w+大学)', ('大学',)),
+                (r'(\w+学院)(?![\w学科专业])', ('学院',))
             ],
             'EnglishUniversity': [
-                r'University[:：]\s*(.+)',
-                r'Institution[:：]\s*(.+)',
-                r'School[:：]\s*(.+)'
+                (r'University[:：]\s*(.+)', ('university',)),
+                (r'Institution[:：]\s*(.+)', ('institution',)),
+                (r'School[:：]\s*(.+)', ('school',))
             ],
             'DegreeLevel': [
-                r'申请学位级别[:：]\s*(.+)',
-                r'学位级别[:：]\s*(.+)',
-                r'学位[:：]\s*(.+)',
-                r'(博士|硕士|学士)学位',
-                r'(博士|硕士|学士)',
-                r'(Doctor|Master|Bachelor)'
+                (r'申请学位级别[:：]\s*(.+)', ('申请学位级别',)),
+                (r'学位级别[:：]\s*(.+)', ('学位级别',)),
+                (r'学位[:：]\s*(.+)', ('学位',)),
+                (r'(博士|硕士|学士)学位', ('学位',)),
+                (r'(博士|硕士|学士)', ('博士', '硕士', '学士')),
+                (r'(Doctor|Master|Bachelor)', ('doctor', 'master', 'bachelor'))
             ],
             'ChineseMajor': [
-                r'学科专业[:：]\s*(.+)',
-                r'专业[:：]\s*(.+)',
-                r'学科[:：]\s*(.+)',
-                r'Major[:：]\s*(.+)'
+                (r'学科专业[:：]\s*(.+)', ('学科专业',)),
+                (r'专业[:：]\s*(.+)', ('专业',)),
+                (r'学科[:：]\s*(.+)', ('学科',)),
+                (r'Major[:：]\s*(.+)', ('major',))
             ],
             'ChineseResearchDirection': [
-                r'研究方向[:：]\s*(.+)',
-                r'专业方向[:：]\s*(.+)',
-                r'Direction[:：]\s*(.+)'
+                (r'研究方向[:：]\s*(.+)', ('研究方向',)),
+                (r'专业方向[:：]\s*(.+)', ('专业方向',)),
+                (r'Direction[:：]\s*(.+)', ('direction',))
             ],
             'ChineseSupervisor': [
-                r'指导教师[姓名]*[:：]\s*(.+?)\s*(?:教授|副教授|讲师)',
-                r'导师[:：]\s*(.+?)\s*(?:教授|副教授|讲师)',
-                r'指导教师[:：]\s*(.+)',
-                r'Supervisor[:：]\s*(?:Prof\.\s*)?(.+)'
+                (r'指导教师[姓名]*[:：]\s*(.+?)\s*(?:教授|副教授|讲师)', ('指导教师',)),
+                (r'导师[:：]\s*(.+?)\s*(?:教授|副教授|讲师)', ('导师',)),
+                (r'指导教师[:：]\s*(.+)', ('指导教师',)),
+                (r'Supervisor[:：]\s*(?:Prof\.\s*)?(.+)', ('supervisor',))
             ],
             'ChineseSupervisorTitle': [
-                r'指导教师.*[:：]\s*.+?\s*(教授|副教授|讲师)',
-                r'职\s*称[:：]\s*(.+)'
+                (r'指导教师.*[:：]\s*.+?\s*(教授|副教授|讲师)', ('指导教师',)),
+                (r'职\s*称[:：]\s*(.+)', ('职',))
             ],
             'College': [
-                r'培养学院[:：]\s*(.+)',
-                r'学院[:：]\s*(.+学院)',
-                r'院系[:：]\s*(.+)'
+                (r'培养学院[:：]\s*(.+)', ('培养学院',)),
+                (r'学院[:：]\s*(.+学院)', ('学院',)),
+                (r'院系[:：]\s*(.+)', ('院系',))
             ],
             'DefenseDate': [
-                r'答辩日期[:：]\s*(.+)',
-                r'论文答辩日期[:：]\s*(.+)',
-                r'Defense Date[:：]\s*(.+)',
-                r'(\d{4}年\d{1,2}月\d{1,2}日)',
-                r'(\d{4}-\d{1,2}-\d{1,2})'
+                (r'答辩日期[:：]\s*(.+)', ('答辩日期',)),
+                (r'论文答辩日期[:：]\s*(.+)', ('论文答辩日期',)),
+                (r'Defense Date[:：]\s*(.+)', ('defense date',)),
+                (r'(\d{4}年\d{1,2}月\d{1,2}日)', ('年',)),
+                (r'(\d{4}-\d{1,2}-\d{1,2})', None)
             ],
             'DegreeGrantingInstitution': [
-                r'学位授予单位[:：]\s*(.+)',
-                r'授予单位[:：]\s*(.+)'
+                (r'学位授予单位[:：]\s*(.+)', ('学位授予单位',)),
+                (r'授予单位[:：]\s*(.+)', ('授予单位',))
             ]
         }
-    
-    def _init_section_patterns(self) -> Dict[str, List[str]]:
-        """初始化章节识别模式"""
         return {
+            field: [(re.compile(pattern, re.MULTILINE | re.IGNORECASE), literals) for pattern, literals in field_patterns]
+            for field, field_patterns in patterns.items()
+        }
+    
+    def _init_section_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """初始化章节识别模式（预编译，IGNORECASE）"""
+        patterns = {
             'cover': ['封面', '扉页', '学位论文'],
             'abstract_cn': [r'摘\s*要', '中文摘要', '内容摘要'],
             'abstract_en': ['abstract', 'english abstract'],
@@ -146,6 +194,10 @@ class EnhancedThesisExtractor:
             'achievements': ['攻读.*学位.*期间.*成果', '发表.*论文', '研究成果'],
             'biography': ['个人简历', '作者简历', 'biography', 'curriculum vitae']
         }
+        return {
+            section: [re.compile(pattern, re.IGNORECASE) for pattern in section_patterns]
+            for section, section_patterns in patterns.items()
+        }
     
     def _init_expected_fields(self) -> List[str]:
         """初始化期望提取的字段列表"""
@@ -167,88 +219,108 @@ class EnhancedThesisExtractor:
             'ApplicationValue', 'ReferenceList'
         ]
     
-    def analyze_document_structure(self, content: str) -> Dict[str, DocumentSection]:
-        """分析文档结构，快速定位各个章节"""
-        lines = content.split('\n')
+    def analyze_document_structure(self, content: str, lines: Optional[List[str]] = None) -> Dict[str, DocumentSection]:
+        """分析文档结构，快速定位各个章节；lines 为调用方已切分好的 content.split('\\n')，可省去重复切分"""
+        if lines is None:
+            lines = content.split('\n')
         sections = {}
         
         print("🔍 分析文档结构...")
         
-        for section_name, patterns in self.section_patterns.items():
-            for i, line in enumerate(lines):
-                line_clean = line.strip().lower()
-                
-                for pattern in patterns:
-                    if re.search(pattern, line_clean, re.IGNORECASE):
-                        # 确定章节结束位置
-                        end_line = self._find_section_end(lines, i, section_name)
-                        
-                        section_content = '\n'.join(lines[i:end_line])
-                        sections[section_name] = DocumentSection(
-                            name=section_name,
-                            start_line=i,
-                            end_line=end_line,
-                            content=section_content,
-                            char_count=len(section_content)
-                        )
-                        
-                        print(f"   📍 {section_name}: 第{i+1}-{end_line}行 ({len(section_content):,} 字符)")
-                        break
-                
-                if section_name in sections:
-                    break
+        # 每个模式在小写全文上只搜索一次（由C层完成，不再逐行调用），最靠前的匹配所在行即章节起始行。
+        # 模式首尾都是非空白字符且匹配不跨行，与逐行 strip().lower() 后搜索的结果一致
+        lowered = content.lower()
+        # 模式都是小写字母与中文，小写文本中只有 ſ、ı 会在忽略大小写时与其中的字母相等；
+        # 两者都不出现时区分大小写的匹配结果相同
+        if 'ſ' in lowered or 'ı' in lowered:
+            scan_patterns = self.section_scan_patterns
+        else:
+            scan_patterns = self.section_scan_patterns_lower
+        start_lines = {}
+        for section_name, patterns in scan_patterns.items():
+            starts = [m.start() for m in (pattern.search(lowered) for pattern in patterns) if m]
+            if starts:
+                start_lines[section_name] = lowered.count('\n', 0, min(starts))
+        
+        # 只为已定位的章节建立结束标记索引
+        boundaries = self._index_section_boundaries(content, lines, start_lines)
+        for section_name, i in start_lines.items():
+            # 确定章节结束位置
+            end_line = self._find_section_end(lines, i, section_name, boundaries)
+            
+            section_content = '\n'.join(lines[i:end_line])
+            sections[section_name] = DocumentSection(
+                name=section_name,
+                start_line=i,
+                end_line=end_line,
+                content=section_content,
+                char_count=len(section_content)
+            )
+            
+            print(f"   📍 {section_name}: 第{i+1}-{end_line}行 ({len(section_content):,} 字符)")
         
         return sections
     
-    def _find_section_end(self, lines: List[str], start: int, section_type: str) -> int:
-        """智能确定章节结束位置"""
-        if section_type == 'abstract_cn':
-            # 中文摘要：寻找关键词或Abstract
-            for i in range(start + 1, min(start + 100, len(lines))):
-                if re.search(r'关键词|keywords?|abstract', lines[i], re.IGNORECASE):
-                    return i
-        
-        elif section_type == 'abstract_en':
-            # 英文摘要：寻找Key words或目录
-            for i in range(start + 1, min(start + 100, len(lines))):
-                if re.search(r'key\s*words?|目\s*录', lines[i], re.IGNORECASE):
-                    return i
-        
-        elif section_type == 'toc':
-            # 目录：寻找第一章或绪论
-            for i in range(start + 1, min(start + 200, len(lines))):
-                if re.search(r'第一章|第1章|绪论|引言', lines[i], re.IGNORECASE):
-                    return i
-        
-        elif section_type == 'references':
-            # 参考文献：寻找致谢或攻读学位期间
-            for i in range(start + 1, len(lines)):
-                line = lines[i].strip()
-                if re.search(r'致谢|攻读.*学位.*期间|个人简历|附录', line, re.IGNORECASE) and len(line) < 50:
-                    return i
+    def _index_section_boundaries(self, content: str, lines: List[str], section_types) -> Dict[str, List[int]]:
+        """对给定章节类型的结束标记各做一次全文扫描，返回 {章节类型: 含结束标记的行号升序列表}。
+        中文摘要找关键词或Abstract，英文摘要找Key words或目录，目录找第一章或绪论，参考文献找致谢或攻读学位期间"""
+        line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+        boundaries = {}
+        for section_type in section_types:
+            if section_type not in SECTION_END_MARKERS:
+                continue
+            pattern, _ = SECTION_END_MARKERS[section_type]
+            indices = []
+            for match in pattern.finditer(content):
+                i = bisect_right(line_starts, match.start()) - 1
+                if indices and indices[-1] == i:
+                    continue
+                if section_type == 'references' and len(lines[i].strip()) >= REFERENCES_END_MAX_LEN:
+                    continue
+                indices.append(i)
+            boundaries[section_type] = indices
+        return boundaries
+    
+    def _find_section_end(self, lines: List[str], start: int, section_type: str,
+                          boundaries: Dict[str, List[int]]) -> int:
+        """智能确定章节结束位置：有专门结束标记的章节在预先建立的行号索引上二分查找"""
+        if section_type in boundaries:
+            _, max_lines = SECTION_END_MARKERS[section_type]
+            stop = len(lines) if max_lines is None else min(start + max_lines, len(lines))
+            indices = boundaries[section_type]
+            j = bisect_right(indices, start)
+            if j < len(indices) and indices[j] < stop:
+                return indices[j]
         
         # 默认：查找下一个章节标题或文档结束
         for i in range(start + 1, min(start + 50, len(lines))):
             line = lines[i].strip()
-            if line and (line.startswith('#') or re.search(r'第.*章|^[A-Z\s]{3,20}$', line)):
+            if line and (line.startswith('#') or DEFAULT_END_RE.search(line)):
                 return i
         
         return min(start + 50, len(lines))
     
-    def extract_metadata_with_patterns(self, content: str, field_name: str) -> List[str]:
-        """使用正则表达式模式提取特定字段"""
+    def extract_metadata_with_patterns(self, content: str, field_name: str, max_per_pattern: int = 16) -> List[str]:
+        """使用正则表达式模式提取特定字段；必含字面量不在文本中的模式直接跳过，不做全文匹配。
+        逐个迭代匹配，每个模式得到 max_per_pattern 个有效结果后即停止，不再生成全部匹配的列表"""
         results = []
         patterns = self.field_patterns.get(field_name, [])
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0] if match[0] else (match[1] if len(match) > 1 else '')
-                
-                match = match.strip()
-                if match and len(match) > 1 and len(match) < 200:
-                    results.append(match)
+        # 忽略大小写时 ſ、ı、İ 可与ASCII字母相等，小写后的子串判断不再可靠，此时不做预筛
+        lowered = None if any(char in content for char in CASE_FOLD_SPECIAL_CHARS) else content.lower()
+        
+        for pattern, literals in patterns:
+            if lowered is not None and literals is not None and not any(literal in lowered for literal in literals):
+                continue
+            # 与 findall 相同：有分组时取第一个分组
+            group = 1 if pattern.groups else 0
+            found = 0
+            for match in pattern.finditer(content):
+                value = (match.group(group) or '').strip()
+                if value and len(value) > 1 and len(value) < 200:
+                    results.append(value)
+                    found += 1
+                    if found >= max_per_pattern:
+                        break
         
         return results
     
@@ -261,7 +333,7 @@ class EnhancedThesisExtractor:
             content = sections['abstract_cn'].content
             # 清理摘要内容
             lines = content.split('\n')[1:]  # 跳过标题行
-            abstract = '\n'.join([line.strip() for line in lines if line.strip() and not re.search(r'关键词|keywords?', line, re.IGNORECASE)])
+            abstract = '\n'.join([line.strip() for line in lines if line.strip() and not ABSTRACT_CN_SKIP_RE.search(line)])
             if len(abstract) > 100:
                 content_fields['ChineseAbstract'] = abstract
         
@@ -269,7 +341,7 @@ class EnhancedThesisExtractor:
         if 'abstract_en' in sections:
             content = sections['abstract_en'].content
             lines = content.split('\n')[1:]  # 跳过标题行
-            abstract = '\n'.join([line.strip() for line in lines if line.strip() and not re.search(r'key\s*words?', line, re.IGNORECASE)])
+            abstract = '\n'.join([line.strip() for line in lines if line.strip() and not ABSTRACT_EN_SKIP_RE.search(line)])
             if len(abstract) > 100:
                 content_fields['EnglishAbstract'] = abstract
         
@@ -277,7 +349,7 @@ class EnhancedThesisExtractor:
         for section_name in ['abstract_cn', 'keywords_cn']:
             if section_name in sections:
                 content = sections[section_name].content
-                keywords_match = re.search(r'关键词[：:](.*?)(?:\n|$)', content, re.IGNORECASE | re.DOTALL)
+                keywords_match = KEYWORDS_CN_RE.search(content)
                 if keywords_match:
                     keywords = keywords_match.group(1).strip()
                     if keywords:
@@ -287,7 +359,7 @@ class EnhancedThesisExtractor:
         for section_name in ['abstract_en', 'keywords_en']:
             if section_name in sections:
                 content = sections[section_name].content
-                keywords_match = re.search(r'key\s*words?[：:](.*?)(?:\n|$)', content, re.IGNORECASE | re.DOTALL)
+                keywords_match = KEYWORDS_EN_RE.search(content)
                 if keywords_match:
                     keywords = keywords_match.group(1).strip()
                     if keywords:
@@ -300,7 +372,7 @@ class EnhancedThesisExtractor:
             toc_lines = []
             for line in content.split('\n')[1:]:  # 跳过标题行
                 line = line.strip()
-                if line and re.search(r'第.*章|[0-9]+\.[0-9]+|###', line):
+                if line and TOC_ENTRY_RE.search(line):
                     toc_lines.append(line)
             
             if toc_lines:
@@ -308,33 +380,25 @@ class EnhancedThesisExtractor:
         
         return content_fields
     
-    def extract_references_accurately(self, content: str) -> List[str]:
-        """精确提取参考文献"""
-        lines = content.split('\n')
+    def extract_references_accurately(self, content: str, lines: Optional[List[str]] = None) -> List[str]:
+        """精确提取参考文献；lines 含义同 analyze_document_structure"""
+        if lines is None:
+            lines = content.split('\n')
         
-        # 找到参考文献开始位置（第一个[1]条目）
-        ref_start = None
-        for i, line in enumerate(lines):
-            if re.match(r'^\[\s*1\s*\]', line.strip()):
-                ref_start = i
-                break
+        # 找到参考文献开始位置（第一个[1]条目）：全文搜索一次，再换算成行号
+        first_entry = REF_FIRST_ENTRY_RE.search(content)
+        ref_start = content.count('\n', 0, first_entry.start()) if first_entry else None
         
         if not ref_start:
             return []
         
-        # 找到参考文献结束位置
+        # 找到参考文献结束位置：先做廉价的长度判断，短的非条目行才跑结束标记正则
         ref_end = len(lines)
-        end_patterns = ['致谢', '攻读.*学位.*期间', '个人简历', '附录', '声明']
-        
-        for i, line in enumerate(lines[ref_start:], ref_start):
-            line = line.strip()
-            if line and not re.match(r'^\[\s*\d+\s*\]', line):
-                for pattern in end_patterns:
-                    if re.search(pattern, line) and len(line) < 100:
-                        ref_end = i
-                        break
-                if ref_end != len(lines):
-                    break
+        for i in range(ref_start, len(lines)):
+            line = lines[i].strip()
+            if line and len(line) < 100 and not REF_ENTRY_RE.match(line) and REF_END_RE.search(line):
+                ref_end = i
+                break
         
         # 提取参考文献条目
         ref_lines = lines[ref_start:ref_end]
@@ -344,7 +408,7 @@ class EnhancedThesisExtractor:
         for line in ref_lines:
             line = line.strip()
             
-            if re.match(r'^\[\s*\d+\s*\]', line):
+            if REF_ENTRY_RE.match(line):
                 if current_ref:
                     references.append(' '.join(current_ref.split()))
                 current_ref = line
@@ -370,7 +434,9 @@ class EnhancedThesisExtractor:
         print("🎯 开始综合信息提取")
         
         # 1. 分析文档结构
-        sections = self.analyze_document_structure(content)
+        # 全文只切分一次，结构分析与参考文献提取共用同一个行列表
+        lines = content.split('\n')
+        sections = self.analyze_document_structure(content, lines)
         
         # 2. 从前置部分（前20%内容）提取元数据
         front_matter_size = min(20000, len(content) // 5)
@@ -401,7 +467,7 @@ class EnhancedThesisExtractor:
         
         # 4. 提取参考文献
         print("📚 提取参考文献...")
-        references = self.extract_references_accurately(content)
+        references = self.extract_references_accurately(content, lines)
         if references:
             extracted_info['ReferenceList'] = references
             print(f"    参考文献: {len(references)} 条")